@@ -1,8 +1,14 @@
 import streamlit as st
 
+from utils.search import search_box
+from utils.warmup import ensure_warm
+
 st.set_page_config(layout='wide')
+# Under plain `streamlit run`, the first session starts the warm-up that serve.py does before startup
+ensure_warm()
 
 st.sidebar.header("**Main 🐼**")
+search_box()
 
 st.markdown("# **Main 🐼**")
 
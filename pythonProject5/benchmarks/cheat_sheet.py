@@ -0,0 +1,59 @@
+"""Elements and payload per view of the cheat sheet, one element per call vs compiled blocks.
+
+`per-call` replays the sheet against real containers, one header or code element per
+call as the page used to render it; `compiled` is what the page renders now.
+
+    python -m benchmarks.cheat_sheet [--output cheat_sheet.json]
+"""
+import argparse
+import json
+
+from benchmarks import common  # noqa: F401  (puts the app's packages on sys.path)
+from benchmarks.suite import walk
+
+SCRIPTS = {
+    'per-call': '''
+import streamlit as st
+from utils import cheatsheet
+
+cheatsheet.cs_sidebar(st.sidebar)
+cheatsheet.cs_body(*st.columns(2))
+''',
+    'compiled': '''
+from utils import cheatsheet
+
+cheatsheet.render()
+''',
+}
+
+
+def measure(script):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(script).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    elements = [e for e in walk(at._tree) if getattr(e, 'proto', None) is not None]
+    return {'elements': len(elements), 'delta_bytes': sum(e.proto.ByteSize() for e in elements)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    results = {mode: measure(script) for mode, script in SCRIPTS.items()}
+    before, after = results['per-call'], results['compiled']
+    for mode, result in results.items():
+        print(f"{mode:<10}{result['elements']:>5} elements{result['delta_bytes']:>9,} bytes")
+    print(f"{'saved':<10}{before['elements'] - after['elements']:>5} elements"
+          f"{before['delta_bytes'] - after['delta_bytes']:>9,} bytes "
+          f"({1 - after['delta_bytes'] / before['delta_bytes']:.0%})")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
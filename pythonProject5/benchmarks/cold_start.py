@@ -0,0 +1,70 @@
+"""Cold-start cost of each General Features section on a fresh interpreter.
+
+Every measurement runs in its own subprocess, so nothing is imported yet when the page
+starts. `eager` imports the whole scientific stack before the first run, which is what the
+page used to do at module top; `lazy` lets the page import on demand.
+
+    python -m benchmarks.cold_start [--repeat 3] [--output cold_start.json]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import APP_DIR, GENERAL_FEATURES, HEAVY_MODULES, SECTIONS, app_test, loaded_heavy_modules
+
+MODES = ('eager', 'lazy')
+
+
+def measure(section, mode):
+    start = time.perf_counter()
+    if mode == 'eager':
+        for name in HEAVY_MODULES:
+            __import__(name)
+    at = app_test(GENERAL_FEATURES, section).run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return {'seconds': elapsed, 'modules': loaded_heavy_modules()}
+
+
+def measure_in_subprocess(section, mode):
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.cold_start', '--child', section, '--mode', mode],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.mode)))
+        return
+
+    results = {}
+    print(f"{'section':<25}{'eager, s':>10}{'lazy, s':>10}  modules loaded lazily")
+    for section in SECTIONS:
+        row = {}
+        for mode in MODES:
+            runs = [measure_in_subprocess(section, mode) for _ in range(args.repeat)]
+            row[mode] = {'seconds': statistics.median(r['seconds'] for r in runs), 'modules': runs[-1]['modules']}
+        results[section] = row
+        print(f"{section:<25}{row['eager']['seconds']:>10.3f}{row['lazy']['seconds']:>10.3f}  "
+              f"{', '.join(row['lazy']['modules']) or '-'}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
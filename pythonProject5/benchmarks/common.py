@@ -0,0 +1,34 @@
+import os
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+MAIN_PAGE = APP_DIR / 'Main_🐼.py'
+PAGES_DIR = APP_DIR / 'pages'
+GENERAL_FEATURES = PAGES_DIR / 'General_Features_🎑.py'
+
+HEAVY_MODULES = ['pandas', 'numpy', 'altair', 'matplotlib.pyplot', 'PIL.Image', 'graphviz', 'pydeck']
+
+# Pages import the shared `utils` package the same way `streamlit run` allows them to
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from sections import TITLES as SECTIONS  # noqa: E402
+from utils import warmup  # noqa: E402
+
+# The background warm-up would run alongside the measured runs and, since tracemalloc is
+# process wide, add to their time and memory; subprocesses and servers inherit this too
+os.environ.setdefault(warmup.ENV_VAR, '0')
+
+
+def app_test(path, section=None, timeout=60):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(path), default_timeout=timeout)
+    if section is not None:
+        at.session_state['info'] = section
+    return at
+
+
+def loaded_heavy_modules():
+    return [name for name in HEAVY_MODULES if name in sys.modules]
@@ -0,0 +1,64 @@
+"""Build and serialization cost of the st.map demo frame vs the large-map columnar mode.
+
+`lists` is the original frame, with colour as a Python list per row, serialized the way
+st.map does it. `columnar` keeps colour as uint8 and radius as float32 columns and is drawn
+by utils.geo.scatter_deck, which sends rounded points as compact JSON up to
+MAX_SCATTER_POINTS rows and binned cells above that.
+
+    python -m benchmarks.map_scale [--rows 10000 100000 1000000] [--output map_scale.json]
+"""
+import argparse
+import json
+import time
+
+from benchmarks.common import APP_DIR  # noqa: F401  (puts the app on sys.path)
+from utils import geo
+from utils.datasets import _map_points, _map_points_typed
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def measure(rows):
+    import numpy as np
+    from streamlit.elements.map import to_deckgl_json
+
+    lists, lists_build = timed(lambda: _map_points(np.random.default_rng(0), (rows, 4)))
+    lists_json, lists_serialize = timed(lambda: to_deckgl_json(lists, 'col1', 'col2', 'col3', 'col4', None))
+
+    typed, typed_build = timed(lambda: _map_points_typed(np.random.default_rng(0), (rows, 4)))
+    typed_json, typed_serialize = timed(lambda: geo.scatter_deck('map_points_typed', (rows, 4)).to_json())
+    _, typed_rerun = timed(lambda: geo.scatter_deck('map_points_typed', (rows, 4)).to_json())
+
+    return {
+        'lists': {'build': lists_build, 'serialize': lists_serialize, 'bytes': len(lists_json),
+                  'memory': int(lists.memory_usage(deep=True).sum())},
+        'columnar': {'build': typed_build, 'serialize': typed_serialize, 'rerun': typed_rerun,
+                     'bytes': len(typed_json), 'memory': int(typed.memory_usage(deep=True).sum())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'rows':>10} {'mode':<9}{'build, s':>10}{'encode, s':>11}{'rerun, s':>10}{'MB sent':>9}{'MB held':>9}")
+    for rows in args.rows:
+        results[rows] = result = measure(rows)
+        for mode, m in result.items():
+            print(f"{rows:>10,} {mode:<9}{m['build']:>10.3f}{m['serialize']:>11.3f}"
+                  f"{m.get('rerun', m['serialize']):>10.3f}{m['bytes'] / 1e6:>9.1f}{m['memory'] / 1e6:>9.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Rerun latency of the toggled examples, full-script rerun vs fragment rerun.
+
+Starts the app on a headless Streamlit server and talks to it over its websocket the way
+the browser does. For every example toggle, the same interaction (switching the example
+on) is sent twice: as a fragment rerun, which is what the browser sends for a widget
+inside an `@example` fragment, and as a full-script rerun, which is what every
+interaction cost before the examples became fragments.
+
+Two figures are kept per rerun: the run time the server reports for the script or
+fragment (its page_profile message), and the round trip from sending the request to
+receiving `script_finished`. On loopback the round trip carries a fixed ~40 ms of TCP
+delayed acknowledgement on top, the same for both kinds of rerun. The first round of
+each is not counted, so both are measured with warm caches.
+
+    python -m benchmarks.rerun_latency [--repeat 5] [--output rerun_latency.json]
+
+Needs the `websockets` package, which comes with Streamlit's Starlette server.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.Checkbox_pb2 import Checkbox
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+from benchmarks.common import APP_DIR, GENERAL_FEATURES, MAIN_PAGE
+
+SECTIONS = ['Display almost anything', 'Data elements', 'Input widgets']
+STARTUP_TIMEOUT = 60
+RUN_TIMEOUT = 120
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def server():
+    """A headless `streamlit run` of the app; yields the websocket URL."""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', str(MAIN_PAGE), '--server.headless', 'true',
+         '--server.port', str(port), '--server.enableXsrfProtection', 'false',
+         # Usage stats on makes the server report each run's execution time in a page_profile
+         # message; nothing leaves the machine, since only the browser would send them on
+         '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'true'],
+        cwd=APP_DIR, env=os.environ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                urllib.request.urlopen(f'http://localhost:{port}/_stcore/health', timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError('the Streamlit server did not start')
+                time.sleep(0.2)
+        yield f'ws://localhost:{port}/_stcore/stream'
+    finally:
+        process.terminate()
+        process.wait()
+
+
+class Session:
+    """One browser tab: a websocket to the app and the widget values the tab would send."""
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self.page = ''
+        self.widgets = {}
+
+    def set(self, widget_id, **value):
+        self.widgets[widget_id] = WidgetState(id=widget_id, **value)
+
+    def rerun(self, fragment_id=''):
+        """Request a rerun; return its latency and the elements it drew."""
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page
+        msg.rerun_script.widget_states.widgets.extend(self.widgets.values())
+        msg.rerun_script.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        self._websocket.send(msg.SerializeToString())
+        elements, pages, exec_time = [], [], None
+        while True:
+            forward = ForwardMsg.FromString(self._websocket.recv(RUN_TIMEOUT))
+            kind = forward.WhichOneof('type')
+            if kind == 'page_profile':
+                exec_time = forward.page_profile.exec_time / 1e6
+            elif kind == 'navigation':
+                pages = list(forward.navigation.app_pages)
+            elif kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+                element = forward.delta.new_element
+                if element.WhichOneof('type') == 'exception':
+                    raise RuntimeError(element.exception.message)
+                elements.append((element, forward.delta.fragment_id))
+            elif kind == 'script_finished':
+                return time.perf_counter() - start, exec_time, elements, pages
+
+
+def open_section(session, section):
+    """Show `section` of General Features; return the toggles it drew and their fragments."""
+    if not session.page:
+        *_, pages = session.rerun()
+        session.page = next(page.page_script_hash for page in pages if page.url_pathname == GENERAL_FEATURES.stem)
+        _, _, elements, _ = session.rerun()
+        radio = next(element.radio.id for element, _ in elements
+                     if element.WhichOneof('type') == 'radio' and element.radio.id.endswith('-info'))
+        session.radio = radio
+    session.set(session.radio, string_value=section)
+    _, _, elements, _ = session.rerun()
+    return [(element.checkbox, fragment_id) for element, fragment_id in elements
+            if element.WhichOneof('type') == 'checkbox' and element.checkbox.type == Checkbox.TOGGLE]
+
+
+def measure(session, section, repeat):
+    results = {}
+    for toggle, fragment_id in open_section(session, section):
+        row = results[toggle.label] = {}
+        for mode, scope in (('full_rerun', ''), ('fragment_rerun', fragment_id)):
+            latency, run_time = [], []
+            for _ in range(repeat + 1):
+                session.set(toggle.id, bool_value=True)
+                seconds, exec_time, _, _ = session.rerun(scope)
+                latency.append(seconds)
+                run_time.append(exec_time)
+                session.set(toggle.id, bool_value=False)
+                session.rerun(scope)
+            row[mode] = {'latency': statistics.median(latency[1:]), 'run_time': statistics.median(run_time[1:])}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    results = {}
+    with server() as url, connect(url, subprotocols=['streamlit'], max_size=None) as websocket:
+        session = Session(websocket)
+        for section in SECTIONS:
+            results[section] = measure(session, section, args.repeat)
+            print(f"{section:<36}{'full: run, round trip':>22}{'fragment: run, round trip':>27}")
+            for label, row in results[section].items():
+                full, fragment = row['full_rerun'], row['fragment_rerun']
+                print(f"    {label:<32}{full['run_time'] * 1000:>10.1f} ms{full['latency'] * 1000:>8.1f} ms"
+                      f"{fragment['run_time'] * 1000:>12.1f} ms{fragment['latency'] * 1000:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
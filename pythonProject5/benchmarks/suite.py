@@ -0,0 +1,143 @@
+"""Headless benchmark of every page and every General Features section.
+
+Each target is run with Streamlit's AppTest in a fresh session per repeat, with every
+example toggle switched on, recording wall time, tracemalloc peak, element count and the
+serialized size of the elements the run produced. Results are written as JSON and compared against a stored baseline; the
+exit status is 1 when any metric regresses past its tolerance, and when there is no baseline to compare with.
+
+The committed baseline holds only the element counts and payload sizes, which are the same on every machine;
+`--update-baseline --all-metrics` also stores time and memory, for comparing runs on one machine.
+
+    python -m benchmarks.suite [--repeat 5] [--output results.json]
+    python -m benchmarks.suite --update-baseline [--all-metrics]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.common import GENERAL_FEATURES, MAIN_PAGE, PAGES_DIR, SECTIONS, app_test
+
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+# Allowed growth over the baseline before a metric counts as a regression; time is
+# compared on the fastest run, which is far less noisy than the median
+TOLERANCES = {'wall_time_min': 1.5, 'peak_memory': 1.25, 'elements': 1.10, 'delta_bytes': 1.10}
+# Differences below these are noise whatever the ratio
+ABSOLUTE_SLACK = {'wall_time_min': 0.005, 'peak_memory': 256 * 1024, 'elements': 0, 'delta_bytes': 0}
+# Metrics that do not depend on the machine the suite runs on
+PORTABLE_METRICS = ['elements', 'delta_bytes']
+
+
+def targets():
+    found = {'Main': (MAIN_PAGE, None)}
+    for path in sorted(PAGES_DIR.glob('*.py')):
+        found[path.stem] = (path, None)
+    for section in SECTIONS:
+        found[f'{GENERAL_FEATURES.stem} / {section}'] = (GENERAL_FEATURES, section)
+    return found
+
+
+def walk(block):
+    for node in block.children.values():
+        if hasattr(node, 'children') and node.children:
+            yield from walk(node)
+        else:
+            yield node
+
+
+def show_all_examples(at):
+    """Run `at`, then switch on every toggle (and any it reveals); returns the last run's AppTest.
+
+    The examples behind the toggles are where the heavy content is, so a measured run
+    must have them all on.
+    """
+    at.run()
+    while not at.exception and any(not toggle.value for toggle in at.toggle):
+        for toggle in at.toggle:
+            toggle.set_value(True)
+        at.run()
+    return at
+
+
+def measure(path, section, repeat):
+    times = []
+    for _ in range(repeat):
+        at = show_all_examples(app_test(path, section))
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f'{path.name} [{section}]: {at.exception[0].value}')
+
+    at = show_all_examples(app_test(path, section))
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    elements = list(walk(at.main)) + list(walk(at.sidebar))
+    return {
+        'wall_time': statistics.median(times),
+        'wall_time_min': min(times),
+        'peak_memory': peak,
+        'elements': len(elements),
+        'delta_bytes': sum(e.proto.ByteSize() for e in elements if getattr(e, 'proto', None) is not None),
+    }
+
+
+def compare(results, baseline):
+    regressions = []
+    for target, metrics in results.items():
+        if target not in baseline:
+            continue
+        for metric, tolerance in TOLERANCES.items():
+            if metric not in baseline[target]:
+                continue
+            old, new = baseline[target][metric], metrics[metric]
+            if new > old * tolerance and new - old > ABSOLUTE_SLACK[metric]:
+                regressions.append(f'{target}: {metric} {old:.4g} -> {new:.4g}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='where to write the results JSON')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--all-metrics', action='store_true',
+                        help='with --update-baseline, also store time and memory, which only compare on this machine')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'target':<55}{'time, ms':>10}{'peak, KiB':>11}{'elements':>10}{'bytes':>10}")
+    for name, (path, section) in targets().items():
+        results[name] = m = measure(path, section, args.repeat)
+        print(f"{name:<55}{m['wall_time'] * 1000:>10.1f}{m['peak_memory'] / 1024:>11.0f}"
+              f"{m['elements']:>10}{m['delta_bytes']:>10}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    if args.update_baseline:
+        if not args.all_metrics:
+            results = {name: {metric: m[metric] for metric in PORTABLE_METRICS} for name, m in results.items()}
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        return 0
+    if not args.baseline.exists():
+        print(f'No baseline at {args.baseline}; run with --update-baseline to create one.')
+        return 1
+
+    regressions = compare(results, json.loads(args.baseline.read_text()))
+    for line in regressions:
+        print('REGRESSION', line)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""API-reference sections of the General Features page, one module per section.
+
+A section module is only imported when it is first shown and stays in `sys.modules`
+afterwards, so a rerun costs the sidebar plus the section on screen. To add a section,
+write a module with a `render()` function and list it here.
+"""
+import importlib
+
+REGISTRY = {
+    'Display almost anything': 'display_almost_anything',
+    'Text elements': 'text_elements',
+    'Data elements': 'data_elements',
+    'Chart elements': 'chart_elements',
+    'Input widgets': 'input_widgets',
+    'Media elements': 'media_elements',
+    'Layouts and containers': 'layouts_and_containers',
+    'Mutate data': 'mutate_data',
+    'Progress and status': 'progress_and_status',
+}
+
+TITLES = list(REGISTRY)
+
+
+def load(title):
+    return importlib.import_module(f'{__name__}.{REGISTRY[title]}')
+
+
+def render(title):
+    return load(title).render()
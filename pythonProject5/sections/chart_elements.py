@@ -0,0 +1,341 @@
+import streamlit as st
+
+from utils import datasets, geo, graphs
+from utils.downsample import downsampled_chart
+from utils.fragments import example
+from utils.lazy import lazy_import
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+pdk = lazy_import('pydeck')
+
+@example
+def area_chart_example():
+    tab_area1, tab_area2 = lazy_tabs(['Output', 'Code'], key='area_chart')
+    if tab_area1:
+        if st.toggle('Large series', key='area_large'):
+            # Downsampled on the server to about one point per pixel of the chart's width
+            rows = st.select_slider('Rows', [100_000, 1_000_000, 5_000_000], format_func='{:,}'.format,
+                                    key='area_rows')
+            downsampled_chart(st.area_chart, 'random_walk', (rows, 3), key='area_downsampled')
+        else:
+            chart_data = datasets.load('chart_data', (20, 3), seed=1)
+
+            st.area_chart(chart_data)
+    if tab_area2:
+        st.code('''
+        import streamlit as st
+        import pandas as pd
+        import numpy as np
+
+        chart_data = pd.DataFrame(np.random.randn(20, 3), columns=["a", "b", "c"])
+
+        st.area_chart(chart_data)
+                ''')
+
+@example
+def bar_chart_example():
+    tab_bar1, tab_bar2 = lazy_tabs(['Output', 'Code'], key='bar_chart')
+    if tab_bar1:
+        chart_data = datasets.load('bar_data', (20, 3))
+
+        st.bar_chart(chart_data, x="col1", y="col2", color="col3")
+    if tab_bar2:
+        st.code('''
+        import streamlit as st
+        import pandas as pd
+        import numpy as np
+
+        chart_data = pd.DataFrame(np.random.randn(20, 3), columns=["a", "b", "c"])
+        st.bar_chart(chart_data)
+                ''')
+
+@example
+def line_chart_example():
+    tab_line1, tab_line2 = lazy_tabs(['Output', 'Code'], key='line_chart')
+    if tab_line1:
+        if st.toggle('Large series', key='line_large'):
+            # Downsampled on the server to about one point per pixel of the chart's width
+            rows = st.select_slider('Rows', [100_000, 1_000_000, 5_000_000], format_func='{:,}'.format,
+                                    key='line_rows')
+            downsampled_chart(st.line_chart, 'random_walk', (rows, 3), key='line_downsampled')
+        else:
+            chart_data = datasets.load('chart_data', (20, 3), seed=2)
+
+            st.line_chart(chart_data)
+    if tab_line2:
+        st.code('''
+        import streamlit as st
+        import pandas as pd
+        import numpy as np
+
+        chart_data = pd.DataFrame(np.random.randn(20, 3), columns=["a", "b", "c"])
+
+        st.line_chart(chart_data)
+                ''')
+
+@example
+def scatter_chart_example():
+    tab_scatter1, tab_scatter2 = lazy_tabs(['Output', 'Code'], key='scatter_chart')
+    if tab_scatter1:
+        chart_data = datasets.load('scatter_data', (20, 3))
+        st.scatter_chart(
+            chart_data,
+            x='col1',
+            y='col2',
+            color='col4',
+            size='col3',
+        )
+    if tab_scatter2:
+        st.code('''
+        import streamlit as st
+        import pandas as pd
+        import numpy as np
+
+        chart_data = pd.DataFrame(np.random.randn(20, 3), columns=["col1", "col2", "col3"])
+        chart_data['col4'] = np.random.choice(['A','B','C'], 20)
+
+        st.scatter_chart(
+            chart_data,
+            x='col1',
+            y='col2',
+            color='col4',
+            size='col3',
+        )
+                ''')
+
+@example
+def map_example():
+    tab_map1, tab_map2 = lazy_tabs(['Output', 'Code'], key='map')
+    if tab_map1:
+        if st.toggle('Large-map mode'):
+            rows = st.select_slider('Rows', [10_000, 100_000, 1_000_000], format_func='{:,}'.format)
+            if rows > geo.MAX_SCATTER_POINTS:
+                st.caption(f'Over {geo.MAX_SCATTER_POINTS:,} points, the points are counted into '
+                           f'{geo.CELL_RESOLUTION} m hexagons on the server and only the hexagons are sent.')
+            st.pydeck_chart(geo.scatter_deck(
+                'map_points_typed', (rows, 4),
+                map_style=None,
+                initial_view_state=pdk.ViewState(latitude=37.76, longitude=-122.4, zoom=11),
+            ))
+        else:
+            df = datasets.load('map_points', (1000, 4))
+
+            st.map(df,
+                   latitude='col1',
+                   longitude='col2',
+                   size='col3',
+                   color='col4')
+    if tab_map2:
+        st.code('''
+        import streamlit as st
+        import pandas as pd
+        import numpy as np
+
+        df = pd.DataFrame({
+            "col1": np.random.randn(1000) / 50 + 37.76,
+            "col2": np.random.randn(1000) / 50 + -122.4,
+            "col3": np.random.randn(1000) * 100,
+            "col4": np.random.rand(1000, 4).tolist(),
+        })
+
+        st.map(df,
+            latitude='col1',
+            longitude='col2',
+            size='col3',
+            color='col4')
+                ''')
+
+@example
+def pydeck_example():
+    tab_pydeck1, tab_pydeck2 = lazy_tabs(['Output', 'Code'], key='pydeck')
+    if tab_pydeck1:
+        col1, col2 = st.columns(2)
+        points = col1.select_slider('Points', [1_000, 100_000, 1_000_000], format_func='{:,}'.format)
+        method = col2.radio('Cells', ['hex', 'grid'], format_func=str.capitalize, horizontal=True)
+
+        # Points are binned on the server, so only the cells are sent whatever the point count
+        cells = geo.aggregate('hex_points', (points, 2), method=method, resolution=200)
+
+        st.pydeck_chart(pdk.Deck(
+            map_style=None,
+            initial_view_state=pdk.ViewState(
+                latitude=37.76,
+                longitude=-122.4,
+                zoom=11,
+                pitch=50,
+            ),
+            layers=[
+                pdk.Layer(
+                    'ColumnLayer',
+                    data=cells,
+                    get_position='[lon, lat]',
+                    get_elevation='weight',
+                    elevation_scale=4000,
+                    radius=180 if method == 'hex' else 200 / 2 ** 0.5 * 0.9,
+                    disk_resolution=6 if method == 'hex' else 4,
+                    angle=0 if method == 'hex' else 45,
+                    get_fill_color='[200, 30, 0, 160]',
+                    pickable=True,
+                    extruded=True,
+                ),
+            ],
+            tooltip={'text': '{count} points'},
+        ))
+    if tab_pydeck2:
+        st.code('''
+        import streamlit as st
+        import pydeck as pdk
+
+        from utils import geo
+
+        col1, col2 = st.columns(2)
+        points = col1.select_slider('Points', [1_000, 100_000, 1_000_000], format_func='{:,}'.format)
+        method = col2.radio('Cells', ['hex', 'grid'], format_func=str.capitalize, horizontal=True)
+
+        # np.random.randn(points, 2) / [50, 50] + [37.76, -122.4], binned on the server into
+        # 200 m cells; only the cells (lat, lon, count, weight) are sent to the browser
+        cells = geo.aggregate('hex_points', (points, 2), method=method, resolution=200)
+
+        st.pydeck_chart(pdk.Deck(
+            map_style=None,
+            initial_view_state=pdk.ViewState(
+                latitude=37.76,
+                longitude=-122.4,
+                zoom=11,
+                pitch=50,
+            ),
+            layers=[
+                pdk.Layer(
+                    'ColumnLayer',
+                    data=cells,
+                    get_position='[lon, lat]',
+                    get_elevation='weight',
+                    elevation_scale=4000,
+                    radius=180 if method == 'hex' else 200 / 2 ** 0.5 * 0.9,
+                    disk_resolution=6 if method == 'hex' else 4,
+                    angle=0 if method == 'hex' else 45,
+                    get_fill_color='[200, 30, 0, 160]',
+                    pickable=True,
+                    extruded=True,
+                ),
+            ],
+            tooltip={'text': '{count} points'},
+        ))
+                    ''')
+
+PROCESS_STATES = (
+    ('run', 'intr'), ('intr', 'runbl'), ('runbl', 'run'), ('run', 'kernel'), ('kernel', 'zombie'),
+    ('kernel', 'sleep'), ('kernel', 'runmem'), ('sleep', 'swap'), ('swap', 'runswap'), ('runswap', 'new'),
+    ('runswap', 'runmem'), ('new', 'runmem'), ('sleep', 'runmem'),
+)
+
+@example
+def graphviz_example():
+    tab_graph1, tab_graph2 = lazy_tabs(['Output', 'Code'], key='graphviz')
+    if tab_graph1:
+        graphs.graphviz_chart(graphs.dot_source(PROCESS_STATES))
+
+    if tab_graph2:
+        st.code('''
+        import streamlit as st
+        import graphviz
+
+        # Create a graphlib graph object
+        graph = graphviz.Digraph()
+        graph.edge('run', 'intr')
+        graph.edge('intr', 'runbl')
+        graph.edge('runbl', 'run')
+        graph.edge('run', 'kernel')
+        graph.edge('kernel', 'zombie')
+        graph.edge('kernel', 'sleep')
+        graph.edge('kernel', 'runmem')
+        graph.edge('sleep', 'swap')
+        graph.edge('swap', 'runswap')
+        graph.edge('runswap', 'new')
+        graph.edge('runswap', 'runmem')
+        graph.edge('new', 'runmem')
+        graph.edge('sleep', 'runmem')
+
+        st.graphviz_chart(graph)
+                ''')
+
+@timed_section
+def Chart_elements():
+    st.markdown('''
+    # Chart elements
+    
+    Streamlit supports several popular data charting libraries like Matplotlib, Altair, deck.gl, and more. 
+    In this section, you can find some examples of bar charts, line charts, maps ect.
+    ''')
+
+    st.markdown('''
+    ### Basic charts
+    ''')
+
+    st.markdown('\n')
+
+    st.markdown('''
+        #### Area chart
+        ''')
+    area_chart_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+            #### Bar chart
+            ''')
+    bar_chart_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+                #### Line chart
+                ''')
+    line_chart_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''#### Scatter plot''')
+    scatter_chart_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''#### Map''')
+    map_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    #### Chart using PyDeck library
+    
+    ***st.pydeck_chart*** draws a chart using the PyDeck library.
+    
+    This supports 3D maps, point clouds, and more! More info about PyDeck at https://deckgl.readthedocs.io/en/latest/.''')
+    pydeck_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''#### Chart using GraphViz library''')
+    graphviz_example()
+
+
+def warm_up():
+    # Called exactly as the examples call them, so the cache keys match
+    datasets.load('chart_data', (20, 3), seed=1)
+    datasets.load('bar_data', (20, 3))
+    datasets.load('chart_data', (20, 3), seed=2)
+    datasets.load('scatter_data', (20, 3))
+    datasets.load('map_points', (1000, 4))
+    for method in geo.BINNERS:
+        geo.aggregate('hex_points', (1_000, 2), method=method, resolution=200)
+    graphs.dot_source(PROCESS_STATES)
+
+
+render = Chart_elements
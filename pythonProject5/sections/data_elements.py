@@ -0,0 +1,230 @@
+import streamlit as st
+
+from utils import datasets, editor
+from utils.fragments import example
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+from utils.windowed import prebuild, windowed_dataframe
+
+@example
+def dataframe_example():
+    if st.toggle('Show dataframe examples'):
+        tab1, tab2 = lazy_tabs(['Output', 'Code'], key='dataframe')
+        if tab1:
+            df = datasets.load('wide_frame', (50, 20))
+
+            st.dataframe(df)
+
+            st.divider()
+            st.markdown('''You can customize the dataframe via ***column_config***,  &nbsp; ***hide_index***, &nbsp; or 
+            ***column_order***:''')
+
+            df0 = datasets.load('app_stats', (3, 30))
+            st.dataframe(
+                df0,
+                column_config={
+                    "name": "App name",
+                    "stars": st.column_config.NumberColumn(
+                        "Github Stars",
+                        help="Number of stars on GitHub",
+                        format="%d ⭐",
+                    ),
+                    "url": st.column_config.LinkColumn("App URL"),
+                    "views_history": st.column_config.LineChartColumn(
+                        "Views (past 30 days)", y_min=0, y_max=5000
+                    ),
+                },
+                hide_index=True,
+            )
+
+            st.divider()
+            st.markdown('''For frames too large to send whole, only one page is serialized; sorting and filtering 
+            happen on the server:''')
+
+            rows = st.select_slider('Rows in the source frame', [100_000, 1_000_000, 10_000_000],
+                                    format_func='{:,}'.format)
+            windowed_dataframe('long_frame', (rows, 5))
+
+        if tab2:
+            st.code('''
+            import streamlit as st
+            import pandas as pd
+            import numpy as np
+
+            df = pd.DataFrame(np.random.randn(50, 20), columns=("col %d" % i for i in range(20)))
+
+            st.dataframe(df)  # Same as st.write(df)
+            
+            ---
+            
+            import random
+            import pandas as pd
+            import streamlit as st
+
+            df = pd.DataFrame(
+                {
+                    "name": ["Roadmap", "Extras", "Issues"],
+                    "url": ["https://roadmap.streamlit.app", "https://extras.streamlit.app", "https://issues.streamlit.app"],
+                    "stars": [random.randint(0, 1000) for _ in range(3)],
+                    "views_history": [[random.randint(0, 5000) for _ in range(30)] for _ in range(3)],
+                }
+            )
+            st.dataframe(
+                df,
+                column_config={
+                    "name": "App name",
+                    "stars": st.column_config.NumberColumn(
+                        "Github Stars",
+                        help="Number of stars on GitHub",
+                        format="%d ⭐",
+                    ),
+                    "url": st.column_config.LinkColumn("App URL"),
+                    "views_history": st.column_config.LineChartColumn(
+                        "Views (past 30 days)", y_min=0, y_max=5000
+                    ),
+                },
+                hide_index=True,
+            )
+
+            ''')
+
+@example
+def data_editor_example():
+    if st.toggle('Show example'):
+        tab3, tab4 = lazy_tabs(['Output', 'Code'], key='data_editor')
+        if tab3:
+            df1 = datasets.load('commands', (3, 3))
+            # Aggregates follow the editor's deltas instead of rescanning edited_df on every edit
+            edited_df, ratings = editor.data_editor(df1, key='commands_editor', value_column='rating',
+                                                    label_column='command', num_rows="dynamic")
+
+            favorite_command = ratings.argmax_label
+            st.markdown(f"Your favorite command is **{favorite_command}** 🎈")
+            if ratings.count:
+                st.caption(f'{ratings.count} rated commands, average rating {ratings.total / ratings.count:.1f}')
+
+        if tab4:
+            st.code('''
+            import streamlit as st
+            import pandas as pd
+
+            df = pd.DataFrame(
+                [
+                   {"command": "st.selectbox", "rating": 4, "is_widget": True},
+                   {"command": "st.balloons", "rating": 5, "is_widget": False},
+                   {"command": "st.time_input", "rating": 3, "is_widget": True},
+               ]
+            )
+            edited_df = st.data_editor(df, num_rows="dynamic")
+
+            favorite_command = edited_df.loc[edited_df["rating"].idxmax()]["command"]
+            st.markdown(f"Your favorite command is **{favorite_command}** 🎈")
+            ''')
+
+@example
+def metric_example():
+    if st.toggle('Show function example'):
+        tab5, tab6 = lazy_tabs(['Output', 'Code'], key='metric')
+        if tab5:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Temperature", "70 °F", "1.2 °F")
+            col2.metric("Wind", "9 mph", "-8%")
+            col3.metric("Humidity", "86%", "4%")
+
+        if tab6:
+            st.code('''
+            import streamlit as st
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Temperature", "70 °F", "1.2 °F")
+            col2.metric("Wind", "9 mph", "-8%")
+            col3.metric("Humidity", "86%", "4%")
+            ''')
+
+@example
+def json_example():
+    if st.toggle('Show a simple example'):
+        tab7, tab8 = lazy_tabs(['Output', 'Code'], key='json')
+        if tab7:
+            st.json({
+                'foo': 'bar',
+                'baz': 'boz',
+                'stuff': [
+                    'stuff 1',
+                    'stuff 2',
+                    'stuff 3',
+                    'stuff 5',
+                ],
+            })
+        if tab8:
+            st.code('''
+            import streamlit as st
+
+            st.json({
+                'foo': 'bar',
+                'baz': 'boz',
+                'stuff': [
+                    'stuff 1',
+                    'stuff 2',
+                    'stuff 3',
+                    'stuff 5',
+                ],
+            })
+            ''')
+
+@timed_section
+def Data_elements():
+    st.markdown('''
+    # Data elements
+    
+    Using Streamlit you can display data in many ways''')
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    ### **st.dataframe**
+    Display a dataframe as an interactive table.
+    
+    This command works with dataframes from Pandas, PyArrow, Snowpark, and PySpark. It can also display several other types 
+    hat can be converted to dataframes, e.g. numpy arrays, lists, sets and dictionaries.
+    ''')
+    dataframe_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    ### st.edit
+    Display a data editor widget.
+    The data editor widget allows you to edit dataframes and many other data structures in a table-like UI.
+    ''')
+    data_editor_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+        ### st.metric
+        Display a metric in big bold font, with an optional indicator of how the metric changed.''')
+    metric_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    ### st.json
+    Display object or string as a pretty-printed JSON string.''')
+    json_example()
+
+    return None
+
+
+def warm_up():
+    datasets.load('wide_frame', (50, 20))
+    datasets.load('app_stats', (3, 30))
+    datasets.load('commands', (3, 3))
+    prebuild('long_frame', (100_000, 5))
+
+
+render = Data_elements
@@ -0,0 +1,136 @@
+import functools
+from pathlib import Path
+
+import streamlit as st
+
+from utils import datasets, figures
+from utils.fragments import example
+from utils.lazy import lazy_import
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+pd = lazy_import('pandas')
+alt = lazy_import('altair')
+
+@example
+def write_example():
+    if st.toggle(('Show write examples')):
+        tab1, tab2 = lazy_tabs(['Outputs', 'Code'], key='write')
+        if tab1:
+            st.write('Hello, *World!* :sunglasses:')
+
+            st.divider()
+
+            st.write(pd.DataFrame({
+                'first column': [1, 2, 3, 4],
+                'second column': [10, 20, 30, 40],
+            }))
+            st.divider()
+
+            df = datasets.load('chart_data', (200, 3))
+            c = alt.Chart(df).mark_circle().encode(x='a', y='b', size='c', color='c', tooltip=['a', 'b', 'c'])
+            st.write(c)
+
+        if tab2:
+            st.code('''
+                import streamlit as st
+                import pandas as pd
+
+                st.write('Hello, *World!* :sunglasses:')
+
+                st.divider() 
+
+                st.write(pd.DataFrame({ 'first column': [1, 2, 3, 4],
+                                        'second column': [10, 20, 30, 40] }))
+
+                st.divider()
+
+                df = pd.DataFrame( np.random.randn(200, 3), columns=['a', 'b', 'c'])
+                c = alt.Chart(df).mark_circle().encode(x='a', y='b', size='c', color='c', tooltip=['a', 'b', 'c'])
+                st.write(c)
+                ''')
+
+# Magic only rewrites the page script, not imported modules like this one, so the magic
+# example is a script of its own that is compiled with the same transform
+MAGIC_DEMO = Path(__file__).with_name('magic_demo.py')
+
+
+@functools.cache
+def magic_demo():
+    """Source of the magic demo script and its code object with magic applied."""
+    from streamlit.runtime.scriptrunner.magic import add_magic
+
+    source = MAGIC_DEMO.read_text(encoding='utf-8')
+    return source, compile(add_magic(source, str(MAGIC_DEMO)), str(MAGIC_DEMO), 'exec')
+
+@example
+def magic_example():
+    if st.toggle(('Show magic examples')):
+        tab3, tab4 = lazy_tabs(['Outputs', 'Code'], key='magic')
+        source, code = magic_demo()
+        if tab3:
+            exec(code, {'__name__': '__main__', '__file__': str(MAGIC_DEMO)})
+
+        if tab4:
+            st.code(source)
+
+@timed_section
+def Display_almost_anything():
+    st.markdown('''
+    # Display almost anything
+    
+    ## How to display and style data?
+
+    Using Streamlit you can do almost everything: draw chars, diagrams, show images, dataframes, write text and ect.
+    At first, I need to present *st.write* and *magic commands*.
+
+    #### ***st.write***
+    This is the Swiss Army knife of Streamlit commands: it does different things depending on what you throw at it. Unlike other Streamlit commands, write() has some unique properties:
+    - You can pass in multiple arguments, all of which will be written.
+    - Its behavior depends on the input types as follows.
+    - It returns None, so its "slot" in the App cannot be reused.
+    
+    **Function signature**: *st.write(*args, unsafe_allow_html=False, **kwargs)*
+    ''')
+
+    write_example()
+
+    st.markdown('\n')
+
+    st.markdown('''
+    #### ***Magic commands***
+    
+    Magic commands are a feature in Streamlit that allows you to write almost anything (markdown, data, charts) 
+    without having to type an explicit command at all. Just put the thing you want to show on its own line of code, 
+    and it will appear in your app. Here's an example:
+    ''')
+
+    magic_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    ##### Differences in Use 
+    
+    Although these methods are pretty similar, there are some reasons to use magic commands to get some additional 
+    advantages:
+    1. Magic and *st.write()* inspect the type of data that you've passed in, and then decide how to best render it in 
+    the app. Sometimes you want to draw it another way. For example, instead of drawing a dataframe as an interactive 
+    table, you may want to draw it as a static table by using *st.table(df)*
+    2. The second reason is that other methods return an object that can be used and modified, either by adding data to 
+    it or replacing it
+    3. Finally, if you use a more specific Streamlit method you can pass additional arguments to customize its behavior
+    ''')
+
+    return None
+
+
+def warm_up():
+    magic_demo()
+    arr = datasets.load('normal_sample', (100,))
+    figures.histogram_png(arr, bins=20)
+    datasets.load('chart_data', (200, 3))
+
+
+render = Display_almost_anything
@@ -0,0 +1,466 @@
+import streamlit as st
+from datetime import time
+from datetime import datetime
+
+from utils import uploads
+from utils.fragments import example
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+@example
+def buttons_example():
+    if st.toggle('Show buttons examples'):
+        tab_but1, tab_but2 = lazy_tabs(['Widget', 'Code'], key='buttons')
+        if tab_but1:
+            st.button("Reset", type="primary")
+            if st.button('Say hello'):
+                st.write('Why hello there')
+            else:
+                st.write('Goodbye')
+
+            st.divider()
+
+            st.link_button("Go to gallery", "https://streamlit.io/gallery")
+
+            st.divider()
+
+            st.markdown('Download a string as a file:')
+            text_contents = '''This is some text'''
+            st.download_button('Download some text', text_contents)
+
+        if tab_but2:
+            st.code('''
+            import streamlit as st
+
+            st.button("Reset", type="primary")
+            if st.button('Say hello'):
+                st.write('Why hello there')
+            else:
+                st.write('Goodbye')
+            
+            st.link_button("Go to gallery", "https://streamlit.io/gallery")
+            
+            # Download a string as a file:
+            text_contents = 'This is some text'
+            st.download_button('Download some text', text_contents)
+            ''')
+
+@example
+def checkbox_example():
+    if st.toggle('Show checkbox example'):
+        tab_check1, tab_check2 = lazy_tabs(['Widget', 'Code'], key='checkbox')
+        if tab_check1:
+            agree = st.checkbox('I agree')
+
+            if agree:
+                st.write('Great!')
+
+        if tab_check2:
+            st.code('''
+            import streamlit as st
+
+            agree = st.checkbox('I agree')
+
+            if agree:
+                st.write('Great!')
+                        ''')
+
+@example
+def toggle_example():
+    if st.toggle('Show toggle example'):
+        tab_t1, tab_t2 = lazy_tabs(['Widget', 'Code'], key='toggle')
+        if tab_t1:
+            on = st.toggle('Activate feature')
+
+            if on:
+                st.write('Feature activated!')
+
+        if tab_t2:
+            st.code('''
+            import streamlit as st
+            
+            on = st.toggle('Activate')
+
+            if on:
+                st.write('Activated!')
+            ''')
+
+@example
+def radio_example():
+    if st.toggle('Show radio example'):
+        tab_rad1, tab_rad2 = lazy_tabs(['Widget', 'Code'], key='radio')
+        if tab_rad1:
+            if "visibility" not in st.session_state:
+                st.session_state.visibility = "visible"
+                st.session_state.disabled = False
+                st.session_state.horizontal = False
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.checkbox("Disable radio widget", key="disabled")
+                st.checkbox("Orient radio options horizontally", key="horizontal")
+
+            with col2:
+                st.radio(
+                    "Set label visibility 👇",
+                    ["visible", "hidden", "collapsed"],
+                    key="visibility",
+                    label_visibility=st.session_state.visibility,
+                    disabled=st.session_state.disabled,
+                    horizontal=st.session_state.horizontal,
+                )
+
+        if tab_rad2:
+            st.code('''
+            import streamlit as st
+            
+            if "visibility" not in st.session_state:
+                st.session_state.visibility = "visible"
+                st.session_state.disabled = False
+                st.session_state.horizontal = False
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.checkbox("Disable radio widget", key="disabled")
+                st.checkbox("Orient radio options horizontally", key="horizontal")
+
+            with col2:
+                st.radio(
+                    "Set label visibility 👇",
+                    ["visible", "hidden", "collapsed"],
+                    key="visibility",
+                    label_visibility=st.session_state.visibility,
+                    disabled=st.session_state.disabled,
+                    horizontal=st.session_state.horizontal,
+                )
+
+            ''')
+
+@example
+def selectbox_example():
+    if st.toggle('Show selectbox example'):
+        tab_select1, tab_select2 = lazy_tabs(['Widget', 'Code'], key='selectbox')
+        if tab_select1:
+            option = st.selectbox(
+                'How would you like to be contacted?',
+                ('Email', 'Home phone', 'Mobile phone'))
+
+            st.write('You selected:', option)
+        if tab_select2:
+            st.code('''
+            import streamlit as st
+            
+            option = st.selectbox(
+                'How would you like to be contacted?',
+                ('Email', 'Home phone', 'Mobile phone'))
+
+            st.write('You selected:', option)
+             ''')
+
+@example
+def multiselect_example():
+    if st.toggle('Show multiselect example'):
+        tab_mselect1, tab_mselect2 = lazy_tabs(['Widget', 'Code'], key='multiselect')
+        if tab_mselect1:
+            options = st.multiselect(
+                'What are your favorite colors',
+                ['Green', 'Yellow', 'Red', 'Blue'],
+                ['Yellow', 'Red'])
+
+            st.write('You selected:', options)
+
+        if tab_mselect2:
+            st.code('''
+            import streamlit as st
+            
+            options = st.multiselect(
+                'What are your favorite colors',
+                ['Green', 'Yellow', 'Red', 'Blue'],
+                ['Yellow', 'Red'])
+
+            st.write('You selected:', options)
+            ''')
+
+@example
+def slider_example():
+    if st.toggle('Show slider xample'):
+        tab_sl1, tab_sl2 = lazy_tabs(['Widget', 'Code'], key='slider')
+        if tab_sl1:
+
+            age = st.slider('How old are you?', 0, 130, 25)
+            st.write("I'm ", age, 'years old')
+
+            values = st.slider(
+                'Select a range of values',
+                0.0, 100.0, (25.0, 75.0))
+            st.write('Values:', values)
+
+            appointment = st.slider(
+                "Schedule your appointment:",
+                value=(time(11, 30), time(12, 45)))
+            st.write("You're scheduled for:", appointment)
+
+            start_time = st.slider(
+                "When do you start?",
+                value=datetime(2020, 1, 1, 9, 30),
+                format="MM/DD/YY - hh:mm")
+            st.write("Start time:", start_time)
+
+        if tab_sl2:
+            st.code('''
+             import streamlit as st
+             from datetime import time
+             from datetime import datetime
+                
+            age = st.slider('How old are you?', 0, 130, 25)
+            st.write("I'm ", age, 'years old')
+
+            values = st.slider(
+                'Select a range of values',
+                0.0, 100.0, (25.0, 75.0))
+            st.write('Values:', values)
+
+            appointment = st.slider(
+                "Schedule your appointment:",
+                value=(time(11, 30), time(12, 45)))
+            st.write("You're scheduled for:", appointment)
+
+            start_time = st.slider(
+                "When do you start?",
+                value=datetime(2020, 1, 1, 9, 30),
+                format="MM/DD/YY - hh:mm")
+            st.write("Start time:", start_time)
+                ''')
+
+@example
+def date_input_example():
+    if st.toggle('Show date_input example'):
+        tab_date1, tab_date2 = lazy_tabs(['Widget', 'Code'], key='date_input')
+        if tab_date1:
+            d = st.date_input("When's your birthday", value=None)
+            st.write('Your birthday is:', d)
+
+        if tab_date2:
+            st.code('''
+                import streamlit as st
+                
+                d = st.date_input("When's your birthday", value=None)
+                st.write('Your birthday is:', d)
+                ''')
+
+@example
+def time_input_example():
+    if st.toggle('Show time_input example'):
+        tab_time1, tab_time2 = lazy_tabs(['Widget', 'Code'], key='time_input')
+        if tab_time1:
+            t = st.time_input('Set an alarm for', value=None)
+            st.write('Alarm is set for', t)
+        if tab_time2:
+            st.code('''
+            import datetime
+            import streamlit as st
+
+            t = st.time_input('Set an alarm for', value=None)
+            st.write('Alarm is set for', t)
+            ''')
+
+@example
+def file_uploader_example():
+    if st.toggle('Show file uploader example'):
+        tab_file1, tab_file2 = lazy_tabs(['Widget', 'Code'], key='file_uploader')
+        if tab_file1:
+            uploaded_files = st.file_uploader("Choose a CSV file", accept_multiple_files=True)
+            for uploaded_file in uploaded_files:
+                st.write("filename:", uploaded_file.name)
+                if not uploaded_file.name.lower().endswith('.csv'):
+                    st.write(f'{uploaded_file.size:,} bytes')
+                    continue
+
+                # Parsed in fixed-size chunks once per file content; only a preview is sent to the browser
+                status = st.empty()
+                summary = uploads.ingest_csv_cached(
+                    uploaded_file, progress=lambda s: status.caption(f'{s.rows:,} rows read...'))
+                if summary.failed:
+                    status.error(f'Could not parse {uploaded_file.name}: {summary.errors[0]}')
+                    continue
+                status.caption(f'{summary.rows:,} rows, {len(summary.dtypes)} columns')
+                for error in summary.errors:
+                    st.warning(error)
+                if summary.preview is not None:
+                    st.dataframe(summary.preview)
+            uploads.release_uploads(uploaded_files)
+
+        if tab_file2:
+            st.code('''
+            import streamlit as st
+
+            from utils import uploads
+
+            uploaded_files = st.file_uploader("Choose a CSV file", accept_multiple_files=True)
+            for uploaded_file in uploaded_files:
+                st.write("filename:", uploaded_file.name)
+                if not uploaded_file.name.lower().endswith('.csv'):
+                    st.write(f'{uploaded_file.size:,} bytes')
+                    continue
+
+                # uploads.ingest_csv infers dtypes from a sample, then reads the file in
+                # chunks of 50,000 rows into a summary; cached per file content across
+                # sessions, so a rerun does not parse the same upload again
+                status = st.empty()
+                summary = uploads.ingest_csv_cached(
+                    uploaded_file, progress=lambda s: status.caption(f'{s.rows:,} rows read...'))
+                if summary.failed:
+                    status.error(f'Could not parse {uploaded_file.name}: {summary.errors[0]}')
+                    continue
+                status.caption(f'{summary.rows:,} rows, {len(summary.dtypes)} columns')
+                for error in summary.errors:
+                    st.warning(error)
+                # Only the first rows are sent to the browser, never the whole file
+                if summary.preview is not None:
+                    st.dataframe(summary.preview)
+
+            # Lets the shared cache evict summaries of files this session no longer has
+            uploads.release_uploads(uploaded_files)
+            ''')
+
+@example
+def color_picker_example():
+    if st.toggle('Show color picker example'):
+        tab_c1, tab_c2 = lazy_tabs(['Widget', 'Code'], key='color_picker')
+        if tab_c1:
+            color = st.color_picker('Pick A Color', '#00f900')
+            st.write('The current color is', color)
+
+        if tab_c2:
+            st.code('''
+            import streamlit as st
+
+            color = st.color_picker('Pick A Color', '#00f900')
+            st.write('The current color is', color)
+            ''')
+
+@timed_section
+def Input_widgets():
+    st.markdown('''
+    # Input widgets
+    
+    With widgets, Streamlit allows you to bake interactivity directly into your apps with buttons, 
+    sliders, text inputs, and more.
+    ''')
+
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+    #### **Buttons**
+    Widget can be in the form of simple button, download button and link button.
+    You can also modify buttons with ***st.session_state.***.
+    ''')
+    buttons_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+        #### **st.checkbox**
+        Display a checkbox widget.
+        ''')
+    checkbox_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+        #### **st.toggle**
+        Display a toggle widget.
+        ''')
+    toggle_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+        #### **st.radio**
+        Display a radio button widget.
+        Here is also an example how to hide widgets lables and make widgets disabled.
+        ''')
+    radio_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+        #### **st.selectbox**
+        Display a select widget
+        ''')
+    selectbox_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+            #### **st.multiselect**
+            Display a multiselect widget.
+            ''')
+    multiselect_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+                #### **st.slider**
+                Display a slider widget.
+                
+                This supports int, float, date, time, and datetime types.
+                This also allows you to render a range slider by passing a two-element tuple or list as the value.
+                ''')
+    slider_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+                #### **st.date_input**
+                Display a date input widget.
+                ''')
+    date_input_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+                    #### **st.time_input**
+                    Display a time input widget.
+                    ''')
+    time_input_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+        #### **st.file_uploader**
+        Display a file uploader widget.
+        
+        By default, uploaded files are limited to 200MB. You can configure this using the server.maxUploadSize config 
+        option. 
+        For more info on how to set config options, see 
+        https://docs.streamlit.io/library/advanced-features/configuration#set-configuration-options
+        
+        Example below allows to upload multiple files at a time.
+        ''')
+    file_uploader_example()
+
+    st.markdown('---')
+    st.markdown('\n\n\n')
+
+    st.markdown('''
+                #### **st.color_picker**
+                Display a color picker widget.
+                ''')
+    color_picker_example()
+
+    return None
+
+
+render = Input_widgets
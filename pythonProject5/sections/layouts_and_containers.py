@@ -0,0 +1,111 @@
+import streamlit as st
+
+from utils import assets, images
+from utils.perf import timed_section
+
+@timed_section
+def Layouts_and_containers():
+    st.markdown('''
+    # Layouts and containers
+    
+    Streamlit provides several options for controlling how different elements are laid out on the screen.
+    ''')
+    if assets.missing_docs_images():
+        st.caption('The images in this section are loaded from docs.streamlit.io. '
+                   'Run `python -m utils.assets fetch` to serve them from the app itself.')
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        with st.container():
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+
+        with st.container():
+            st.image(images.source('sidebar', columns=2))
+            st.markdown('#### **Sidebar**')
+            st.caption('Display items in a sidebar.')
+            st.code('''
+                    st.sidebar.write('This lives in the sidebar')
+                    st.sidebar.button('Click me!')
+                    ''')
+
+        with st.container():
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+
+        with st.container():
+            st.image(images.source('tabs', columns=2))
+            st.markdown('#### **Tabs**')
+            st.caption('Insert containers separated into tabs.')
+            st.code('''
+            tab1, tab2 = st.tabs(['Tab1', 'Tab 2'])
+            tab1.write('this is tab 1')
+            tab2.write('this is tab 2')
+            ''')
+
+        with st.container():
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+
+        with st.container():
+            st.image(images.source('container', columns=2))
+            st.markdown('#### **Container**')
+            st.caption('Insert a multi-element container.')
+            st.code('''
+            c = st.container()
+            st.write('This will show last')
+            c.write('This will show first')
+            c.write('This will show second')
+            ''')
+
+    with col2:
+        with st.container():
+            st.image(images.source('columns', columns=2))
+            st.markdown('#### **Columns**')
+            st.caption('Insert containers laid out as side-by-side columns.')
+            st.code('''
+                        col1, col2 = st.columns(2)
+                        col1.write('this is column 1')
+                        col2.write('this is column 2')
+                        ''')
+
+        with st.container():
+            st.markdown('\n\n\n')
+
+        with st.container():
+            st.image(images.source('expander', columns=2))
+            st.markdown('#### **Expander**')
+            st.caption('Insert a multi-element container that can be expanded/collapsed.')
+            st.code('''
+            with st.expander('Open to see more'):
+               st.write('This is more content')
+            ''')
+
+        with st.container():
+            st.markdown('\n\n\n')
+            st.markdown('\n\n\n')
+
+        with st.container():
+            st.image(images.source('empty', columns=2))
+            st.markdown('#### **Empty**')
+            st.caption('Insert a single-element container.')
+            st.code('''
+                        c = st.container()
+                        st.write('This will show last')
+                        c.write('This will be replaced')
+                        c.write('This will show first')
+                        ''')
+
+
+def warm_up():
+    for name in assets.DOCS_IMAGES:
+        images.source(name, columns=2)
+
+
+render = Layouts_and_containers
@@ -0,0 +1,16 @@
+# Magic commands: each expression on a line of its own is drawn as if passed to st.write
+import pandas as pd
+import streamlit as st
+
+from utils import datasets, figures
+
+df = pd.DataFrame({'col1': [1, 2, 3]})
+df  # 👈 Draw the dataframe
+
+x = 10
+'x', x  # 👈 Draw the string 'x' and then the value of x
+
+# Magic also draws charts and Matplotlib figures; this histogram is drawn once and
+# cached as a PNG instead of building a new figure on every rerun, so it goes to st.image
+arr = datasets.load('normal_sample', (100,))
+st.image(figures.histogram_png(arr, bins=20))
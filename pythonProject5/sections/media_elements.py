@@ -0,0 +1,85 @@
+import streamlit as st
+
+from utils import assets, images, waveform
+from utils.fragments import example
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+@example
+def image_example():
+    tab1, tab2 = lazy_tabs(['Image', 'Code'], key='image')
+    if tab1:
+        st.image(images.source('parrots'), caption='Yes. Pink parrots aka galahs.')
+    if tab2:
+        st.code('''
+        st.image("https://github.com/RenLinV/Streamlit_presentation/blob/main/pythonProject5/parrots.jpg?raw=true", caption='Yes. Pink parrots aka galahs.')
+        ''')
+
+@example
+def audio_example():
+    tab3, tab4 = lazy_tabs(['Audio', 'Code'], key='audio')
+    if tab3:
+        st.audio(assets.source('guren_no_yamiya'), format='audio/mpeg')
+        waveform.waveform_chart(assets.path('guren_no_yamiya'))
+    if tab4:
+        st.code('''
+        st.audio("https://github.com/RenLinV/Streamlit_presentation/blob/main/pythonProject5/Aot_guren_no_yamiya.mp3?raw=true",format='audio/ogg')
+        ''')
+
+@example
+def video_example():
+    tab5, tab6 = lazy_tabs(['Audio', 'Code'], key='video')
+    if tab5:
+        st.video("https://youtu.be/rwCJvSKzQkc?si=QO0ldGJwOOLFozY_")
+    if tab6:
+        st.code('''
+        st.video("https://youtu.be/rwCJvSKzQkc?si=QO0ldGJwOOLFozY_")
+        ''')
+
+@timed_section
+def Media_elements():
+    st.markdown('''
+    # Media elements
+    ''')
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    #### Images
+    ***st.image*** displays an image of list of images
+    ''')
+    image_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+    #### Audio
+    ***st.audio***  displays an audio player.
+    
+    In the example below you can listen to extra heart-warming composition "Guren No Yamiya" from "Attack On Titan" ☺️
+    ''')
+    audio_example()
+
+    st.markdown('\n')
+    st.markdown('\n')
+
+    st.markdown('''
+        #### Video
+        ***st.video***  displays an video player.
+
+        In the example below why not to continue with AOT 🙃.
+        ''')
+    video_example()
+
+
+def warm_up():
+    images.source('parrots')
+    try:
+        waveform.overview(assets.path('guren_no_yamiya'))
+    except (waveform.NoDecoder, waveform.DecodeError):
+        pass
+
+
+render = Media_elements
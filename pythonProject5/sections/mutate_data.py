@@ -0,0 +1,72 @@
+import streamlit as st
+
+from utils import stream
+from utils.fragments import example
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+@example
+def live_chart_example():
+    tab1, tab2 = lazy_tabs(['Output', 'Code'], key='live_chart')
+    if tab1:
+        col1, col2 = st.columns(2)
+        rate = col1.select_slider('Rows per second', [100, 1_000, 10_000], value=1_000, format_func='{:,}'.format)
+        duration = col2.select_slider('Stream for (s)', [10, 30, 60, 300])
+        if st.button('Start streaming'):
+            delivered = stream.live_chart('live', rate, duration)
+            st.caption(f'Stream finished after {delivered:,} rows')
+    if tab2:
+        if stream.HAS_ADD_ROWS:
+            st.code('''
+            import time
+            import numpy as np
+            import pandas as pd
+            import streamlit as st
+
+            chart = st.line_chart(pd.DataFrame(np.random.randn(1, 3)))
+
+            for i in range(100):
+                new_rows = pd.DataFrame(np.random.randn(10, 3))
+                chart.add_rows(new_rows)
+                time.sleep(0.1)
+            ''')
+        else:
+            st.code('''
+            import time
+            import numpy as np
+            import pandas as pd
+            import streamlit as st
+
+            placeholder = st.empty()
+            data = np.random.randn(1, 3)
+
+            for i in range(20):
+                data = np.concatenate([data, np.random.randn(50, 3)])[-5_000:]
+                # Every redraw sends the whole chart, so average it down to 500 points first
+                step = -(-len(data) // 500)
+                shown = data[:len(data) // step * step].reshape(-1, step, 3).mean(axis=1)
+                placeholder.line_chart(pd.DataFrame(shown))
+                time.sleep(0.5)
+            ''')
+
+@timed_section
+def Mutate_data():
+    st.markdown('''
+    # Mutate data
+
+    Elements such as charts and dataframes can be extended after they are drawn with *add_rows()*, so only the new
+    rows are sent to the browser. Below, a background thread produces rows into a fixed-size buffer for this session.
+    ''')
+    if stream.HAS_ADD_ROWS:
+        st.markdown('The chart is appended to with *add_rows()* ten times a second.')
+    else:
+        st.markdown(f'''
+        This version of Streamlit has no *add_rows()*, so the chart is redrawn in place instead, and every redraw sends
+        the whole chart again. To keep that small, it is redrawn every {stream.REDRAW_TICK:g} s from the buffer averaged
+        down to at most {stream.REDRAW_POINTS:,} points.
+        ''')
+    live_chart_example()
+    return None
+
+
+render = Mutate_data
@@ -0,0 +1,89 @@
+import streamlit as st
+
+from utils import jobs
+from utils.fragments import example
+from utils.lazy import lazy_import
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+np = lazy_import('numpy')
+
+
+def estimate_pi(job, samples, chunks=20, seed=None):
+    """Monte Carlo estimate of pi, reporting progress after each chunk."""
+    rng = np.random.default_rng(seed)
+    inside = 0
+    per_chunk = samples // chunks
+    for i in range(chunks):
+        points = rng.random((per_chunk, 2))
+        inside += int(np.count_nonzero((points ** 2).sum(axis=1) <= 1))
+        job.update((i + 1) / chunks, f'{(i + 1) * per_chunk:,} of {per_chunk * chunks:,} samples')
+    return f'π ≈ {4 * inside / (per_chunk * chunks):.6f}'
+
+
+@example
+def jobs_example():
+    tab1, tab2 = lazy_tabs(['Output', 'Code'], key='jobs')
+    if tab1:
+        col1, col2 = st.columns(2)
+        samples = col1.select_slider('Samples', [1_000_000, 10_000_000, 50_000_000], format_func='{:,}'.format)
+        if col1.button('Start job'):
+            try:
+                jobs.submit(f'Estimate π from {samples:,} samples', estimate_pi, samples)
+            except jobs.QueueFull as e:
+                st.warning(f'Try again later: {e}')
+        if col2.button('Clear finished'):
+            jobs.clear_finished()
+
+        jobs.job_panel()
+    if tab2:
+        st.code('''
+        import numpy as np
+        import streamlit as st
+
+        from utils import jobs
+
+
+        def estimate_pi(job, samples, chunks=20):
+            rng = np.random.default_rng()
+            inside = 0
+            per_chunk = samples // chunks
+            for i in range(chunks):
+                points = rng.random((per_chunk, 2))
+                inside += int(np.count_nonzero((points ** 2).sum(axis=1) <= 1))
+                # Read by the polling panel; the worker never touches Streamlit
+                job.update((i + 1) / chunks, f'{(i + 1) * per_chunk:,} of {samples:,} samples')
+            return f'π ≈ {4 * inside / (per_chunk * chunks):.6f}'
+
+
+        col1, col2 = st.columns(2)
+        samples = col1.select_slider('Samples', [1_000_000, 10_000_000, 50_000_000], format_func='{:,}'.format)
+        if col1.button('Start job'):
+            try:
+                # Queued on the shared worker pool; only the job id goes into session state
+                jobs.submit(f'Estimate π from {samples:,} samples', estimate_pi, samples)
+            except jobs.QueueFull as e:
+                st.warning(f'Try again later: {e}')
+        if col2.button('Clear finished'):
+            jobs.clear_finished()
+
+        # Draws this session's jobs; while one is running, an st.fragment(run_every=0.5)
+        # inside redraws just the panel twice a second
+        jobs.job_panel()
+        ''')
+
+@timed_section
+def Progress_and_status():
+    st.markdown('''
+    # Progress and status
+
+    *st.spinner*, *st.progress* and *st.status* show that something is happening, but if the work runs in the script
+    itself, the session can do nothing else until it finishes. Here the work runs on a shared pool of background
+    workers instead: the page only keeps the job ids, and a small fragment polls their progress twice a second.
+    Start several jobs and keep using the page while they run.
+    ''')
+    jobs_example()
+    return None
+
+
+render = Progress_and_status
@@ -0,0 +1,50 @@
+import streamlit as st
+
+from utils.fragments import example
+from utils.perf import timed_section
+from utils.tabs import lazy_tabs
+
+@example
+def text_example():
+    tab1, tab2 = lazy_tabs(['Text', 'Code'], key='text')
+    if tab1:
+        st.markdown(
+            ''' :red[Streamlit] :orange[can] :green[write] :blue[text]. ''')
+
+        st.divider()
+
+        st.text('This is some text.')
+
+        st.divider()
+
+        st.latex(r'''
+                        a + ar + a r^2 + a r^3 + \cdots + a r^{n-1} =
+                        \sum_{k=0}^{n-1} ar^k =
+                        a \left(\frac{1-r^{n}}{1-r}\right)
+                        ''')
+    if tab2:
+        st.code('''
+        st.markdown(' :red[Streamlit] :orange[can] :green[write] :blue[text]. ')
+        
+        st.text('This is some text.')
+        
+        st.latex(r'
+                a + ar + a r^2 + a r^3 + \cdots + a r^{n-1} =
+                \sum_{k=0}^{n-1} ar^k =
+                a \left(\\frac{1-r^{n}}{1-r}\\right)
+                ')
+        ''')
+
+@timed_section
+def Text_elements():
+    st.markdown('''
+    # Text elements
+    
+    In Streamlit you can use both Markdown and LaTeX write text and formulas using their own syntax. 
+    It is also possible to insert code.
+    ''')
+    text_example()
+    return None
+
+
+render = Text_elements
@@ -0,0 +1,63 @@
+"""Start the app after warming up the process, so the first visitor is not the one paying for it.
+
+    python serve.py [streamlit run options...]
+
+Same as `streamlit run Main_🐼.py`, except that heavy libraries are imported and the
+demo caches are filled before the server starts listening. APP_WARM_UP=0 skips that.
+"""
+import logging
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+MAIN_PAGE = APP_DIR / 'Main_🐼.py'
+
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+
+def load_config(argv):
+    """Apply the config files and the `streamlit run` flags in `argv` the way `streamlit run` does.
+
+    Warm-up reads config options, so they have to be final before it starts. Otherwise it
+    would see the defaults, not flags such as --server.enableStaticServing, and Streamlit
+    would report the [server] section as changed once it applies the flags itself.
+    """
+    from streamlit import config
+    from streamlit.web import bootstrap
+    from streamlit.web import cli as stcli
+
+    context = stcli.main_run.make_context('run', [str(MAIN_PAGE), *argv], resilient_parsing=True)
+    # What `streamlit run` sets first, so the app's own .streamlit/config.toml is read too
+    config._main_script_path = str(MAIN_PAGE)
+    bootstrap.load_config_options({name: value for name, value in context.params.items()
+                                   if name not in ('target', 'args')})
+
+
+def main():
+    from streamlit.web import cli as stcli
+
+    from utils import warmup
+
+    if warmup.enabled():
+        load_config(sys.argv[1:])
+        start = time.perf_counter()
+        try:
+            timings = warmup.warm_up()
+        except Exception:
+            # Warming up only saves the first visitors some time; never let it stop the server
+            logging.getLogger(__name__).exception('Warm-up failed; starting the server anyway')
+        else:
+            slowest = sorted((step for step in timings if step != 'total'), key=timings.get, reverse=True)[:3]
+            print(f'Warm-up took {time.perf_counter() - start:.2f} s '
+                  f'(slowest: {", ".join(f"{step} {timings[step]:.2f} s" for step in slowest)})', flush=True)
+            if warmup.failures:
+                print(f'Warm-up steps that failed (see the log): {", ".join(warmup.failures)}', flush=True)
+
+    sys.argv = ['streamlit', 'run', str(MAIN_PAGE), *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Tests import the app's packages the same way the pages do
+APP_DIR = Path(__file__).resolve().parent.parent
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
@@ -0,0 +1,35 @@
+import pytest
+
+from utils import assets
+
+JPEG = b'\xff\xd8\xff\xe0' + b'\0' * 64
+
+
+@pytest.fixture
+def docs_host(tmp_path):
+    """A local stand-in for docs.streamlit.io/images/api, reached through a file:// URL."""
+    host = tmp_path / 'host'
+    host.mkdir()
+    for name in assets.DOCS_IMAGES:
+        (host / f'{name}.jpg').write_bytes(JPEG)
+    return host
+
+
+def test_fetch_stores_every_docs_image(docs_host, tmp_path):
+    target = tmp_path / 'api'
+    assets.fetch(url=docs_host.as_uri() + '/{}.jpg', target=target)
+    assert sorted(p.name for p in target.iterdir()) == sorted(f'{name}.jpg' for name in assets.DOCS_IMAGES)
+    assert all((target / f'{name}.jpg').read_bytes() == JPEG for name in assets.DOCS_IMAGES)
+
+
+def test_fetch_rejects_anything_but_jpeg(docs_host, tmp_path):
+    (docs_host / f'{assets.DOCS_IMAGES[0]}.jpg').write_bytes(b'<html>Not found</html>')
+    with pytest.raises(ValueError):
+        assets.fetch(url=docs_host.as_uri() + '/{}.jpg', target=tmp_path / 'api')
+    assert not (tmp_path / 'api' / f'{assets.DOCS_IMAGES[0]}.jpg').exists()
+
+
+def test_docs_images_are_missing_until_fetched(monkeypatch, tmp_path):
+    monkeypatch.setattr(assets, 'ASSETS_DIR', tmp_path)
+    assert assets.missing_docs_images() == assets.DOCS_IMAGES
+    assert assets.path('tabs') == tmp_path / 'api' / 'tabs.jpg'
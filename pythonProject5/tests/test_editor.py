@@ -0,0 +1,75 @@
+import math
+import random
+
+import pandas as pd
+import pytest
+
+from utils.editor import EditAggregates
+
+ROWS = 12
+
+
+def random_value(rng):
+    return rng.choice([None, float('nan'), rng.randint(-5, 5), rng.uniform(-5, 5)])
+
+
+def apply(data, delta):
+    """What the edited frame looks like after `delta`, built the way st.data_editor does."""
+    frame = data.copy()
+    for row, edit in delta['edited_rows'].items():
+        for column, value in edit.items():
+            frame.loc[row, column] = value
+    frame = frame.drop(index=delta['deleted_rows'])
+    added = pd.DataFrame(delta['added_rows'], columns=data.columns)
+    frame = pd.concat([frame, added], ignore_index=True) if len(added) else frame.reset_index(drop=True)
+    frame['value'] = pd.to_numeric(frame['value'])
+    return frame
+
+
+def step(rng, delta):
+    """One editor interaction: edit, delete, restore or add a row, or undo an added row."""
+    action = rng.choice(['edit', 'edit', 'clear', 'delete', 'restore', 'add', 'edit_added', 'remove_added'])
+    row = rng.randrange(ROWS)
+    if action == 'edit':
+        edit = delta['edited_rows'].setdefault(row, {})
+        if rng.random() < 0.7:
+            edit['value'] = random_value(rng)
+        else:
+            edit['label'] = f'label{rng.randrange(99)}'
+    elif action == 'clear':
+        delta['edited_rows'].pop(row, None)
+    elif action == 'delete' and row not in delta['deleted_rows']:
+        delta['deleted_rows'].append(row)
+    elif action == 'restore' and delta['deleted_rows']:
+        delta['deleted_rows'].remove(rng.choice(delta['deleted_rows']))
+    elif action == 'add':
+        delta['added_rows'].append({'value': random_value(rng), 'label': f'new{rng.randrange(99)}'})
+    elif action == 'edit_added' and delta['added_rows']:
+        rng.choice(delta['added_rows'])['value'] = random_value(rng)
+    elif action == 'remove_added' and delta['added_rows']:
+        delta['added_rows'].pop(rng.randrange(len(delta['added_rows'])))
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_matches_pandas_after_every_edit(seed):
+    rng = random.Random(seed)
+    data = pd.DataFrame({
+        'value': [random_value(rng) for _ in range(ROWS)],
+        'label': [f'row{i}' for i in range(ROWS)],
+    }).astype({'value': float})
+    aggregates = EditAggregates(data, 'value', 'label')
+    delta = {'edited_rows': {}, 'added_rows': [], 'deleted_rows': []}
+
+    for _ in range(40):
+        step(rng, delta)
+        # The editor hands over a fresh copy of its state on every rerun
+        aggregates.update({key: (dict(value) if isinstance(value, dict) else list(value))
+                           for key, value in delta.items()})
+        expected = apply(data, delta)
+        values = expected['value']
+        assert aggregates.count == values.count()
+        assert math.isclose(aggregates.total, values.sum(), abs_tol=1e-9)
+        if values.count():
+            assert aggregates.argmax_label == expected.loc[values.idxmax(), 'label']
+        else:
+            assert aggregates.argmax_label is None
@@ -0,0 +1,52 @@
+import wave
+
+import numpy as np
+import pytest
+
+from utils import waveform
+
+
+@pytest.fixture(autouse=True)
+def no_ffmpeg(monkeypatch):
+    """Decode with the `wave` fallback whether or not ffmpeg is installed."""
+    monkeypatch.setattr(waveform.shutil, 'which', lambda name: None)
+
+
+def write_wav(path, width, samples, channels=1, rate=8000):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(width)
+        f.setframerate(rate)
+        f.writeframes(samples)
+    return path
+
+
+@pytest.mark.parametrize('width', [1, 2, 3, 4])
+def test_pcm_wav_peaks_span_the_signal(tmp_path, width):
+    signal = np.sin(np.linspace(0, 40 * np.pi, 8000))
+    full = (signal * (2 ** 31 - 1)).astype('<i4')
+    if width == 1:
+        raw = ((full >> 24) + 128).astype('u1').tobytes()
+    else:
+        # The top `width` bytes of each little-endian 32-bit sample
+        raw = full.view('u1').reshape(-1, 4)[:, 4 - width:].tobytes()
+    peaks = waveform.compute_peaks(write_wav(tmp_path / 'tone.wav', width, raw))
+    assert peaks.shape == (waveform.PEAKS_PER_SECOND, 2)
+    assert peaks[:, 0].min() == pytest.approx(-1, abs=0.02)
+    assert peaks[:, 1].max() == pytest.approx(1, abs=0.02)
+
+
+def test_unreadable_wav_raises_decode_error(tmp_path):
+    path = tmp_path / 'broken.wav'
+    path.write_bytes(b'RIFF\0\0\0\0WAVEjunk')
+    with pytest.raises(waveform.DecodeError):
+        waveform.compute_peaks(path)
+
+
+def test_chart_falls_back_to_a_caption(tmp_path, monkeypatch):
+    path = tmp_path / 'broken.wav'
+    path.write_bytes(b'not audio')
+    captions = []
+    monkeypatch.setattr(waveform.st, 'caption', captions.append)
+    waveform.waveform_chart(path)
+    assert captions and captions[0].startswith('No waveform preview: broken.wav')
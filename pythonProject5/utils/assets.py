@@ -0,0 +1,197 @@
+"""Media served from the app's own static directory under content-hashed names.
+
+    python -m utils.assets fetch    # store the docs images locally, once, for offline use
+"""
+import base64
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import shutil
+import sys
+import threading
+import urllib.request
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+
+try:
+    from streamlit.url_util import is_relative_static_url  # noqa: F401
+    # Only Streamlit versions with this helper accept /app/static/ URLs in st.image and st.audio
+    _STATIC_URLS_SUPPORTED = True
+except ImportError:
+    _STATIC_URLS_SUPPORTED = False
+
+APP_DIR = Path(__file__).resolve().parent.parent
+# Served at /app/static/ when server.enableStaticServing is on; rebuilt from the sources below
+STATIC_DIR = APP_DIR / 'static'
+STATIC_URL = '/app/static/'
+ASSETS_DIR = APP_DIR / 'assets'
+
+ASSETS = {
+    'parrots': APP_DIR / 'parrots.jpg',
+    'guren_no_yamiya': APP_DIR / 'Aot_guren_no_yamiya.mp3',
+}
+
+# Images from the Streamlit docs shown by the layout section, stored under assets/api by `fetch`
+DOCS_IMAGES = ['sidebar', 'tabs', 'container', 'columns', 'expander', 'empty']
+DOCS_IMAGE_URL = 'https://docs.streamlit.io/images/api/{}.jpg'
+
+_LOGGER = logging.getLogger(__name__)
+
+# Memory the shared cache of base64-encoded assets may use
+ENCODED_CACHE_BYTES = 32 * 2 ** 20
+
+
+def path(name):
+    return ASSETS[name] if name in ASSETS else ASSETS_DIR / 'api' / f'{name}.jpg'
+
+
+def content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def publish(path):
+    """Copy `path` into STATIC_DIR as `<stem>.<hash><suffix>` and drop older copies of it.
+
+    A changed file gets a new name, so a URL always means the same bytes. Streamlit sends
+    no Cache-Control header for static files, so long-lived caching of those URLs needs a
+    proxy rule in front of the app.
+    """
+    path = Path(path)
+    target = STATIC_DIR / f'{path.stem}.{content_hash(path)[:12]}{path.suffix}'
+    if not target.exists():
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+    copy = re.compile(rf'{re.escape(path.stem)}\.[0-9a-f]{{12}}{re.escape(path.suffix)}')
+    for stale in STATIC_DIR.iterdir():
+        if stale != target and copy.fullmatch(stale.name):
+            stale.unlink(missing_ok=True)
+    return target.name
+
+
+@st.cache_resource(show_spinner=False)
+def manifest():
+    """Static file name of every asset available locally, published once per process."""
+    names = list(ASSETS) + DOCS_IMAGES
+    if missing_docs_images():
+        _LOGGER.warning('Docs images %s are not under %s and load from docs.streamlit.io; '
+                        'run `python -m utils.assets fetch` to serve them locally',
+                        ', '.join(missing_docs_images()), ASSETS_DIR / 'api')
+    return {name: publish(path(name)) for name in names if path(name).exists()}
+
+
+def missing_docs_images():
+    """Docs images that were never fetched, so source() falls back to docs.streamlit.io for them."""
+    return [name for name in DOCS_IMAGES if not path(name).exists()]
+
+
+def static_serving():
+    return _STATIC_URLS_SUPPORTED and st.get_option('server.enableStaticServing')
+
+
+def source(name):
+    """What to pass to st.image or st.audio for asset `name`.
+
+    A content-hashed /app/static/ URL when static serving is on, else the local file (sent
+    through Streamlit's media endpoint). A docs image that was never fetched falls back to
+    its original URL.
+    """
+    files = manifest()
+    if name not in files:
+        return DOCS_IMAGE_URL.format(name)
+    if static_serving():
+        return STATIC_URL + files[name]
+    return str(path(name))
+
+
+@dataclass
+class EncodedAsset:
+    data: str
+    etag: str
+    mime: str
+
+    @property
+    def data_uri(self):
+        return f'data:{self.mime};base64,{self.data}'
+
+
+class AssetEncoder:
+    """Base64 encodings of files, memoized by (path, mtime, size) in an LRU bounded by bytes.
+
+    A file is only read again once it changes on disk. The ETag is derived from the content,
+    so it survives a touch that leaves the bytes alone.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, path):
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        content = path.read_bytes()
+        asset = EncodedAsset(
+            data=base64.b64encode(content).decode(),
+            etag=f'"{hashlib.sha256(content).hexdigest()[:16]}"',
+            mime=mimetypes.guess_type(path.name)[0] or 'application/octet-stream',
+        )
+        with self._lock:
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self.size -= len(self._entries.pop(stale).data)
+            self._entries[key] = asset
+            self.size += len(asset.data)
+            while self.size > self.budget and len(self._entries) > 1:
+                self.size -= len(self._entries.popitem(last=False)[1].data)
+        return asset
+
+
+@st.cache_resource
+def encoder():
+    return AssetEncoder(ENCODED_CACHE_BYTES)
+
+
+def encode(path):
+    """The file at `path` base64-encoded, with its ETag and MIME type."""
+    return encoder().encode(path)
+
+
+def fetch(url=DOCS_IMAGE_URL, target=ASSETS_DIR / 'api'):
+    """Download the docs images into `target` so the app needs no third-party host."""
+    target = Path(target)
+    for name in DOCS_IMAGES:
+        with urllib.request.urlopen(url.format(name), timeout=30) as response:
+            content = response.read()
+        if not content.startswith(b'\xff\xd8'):
+            raise ValueError(f'{url.format(name)} is not a JPEG image')
+        target.mkdir(parents=True, exist_ok=True)
+        tmp = target / f'{name}.jpg.{os.getpid()}.tmp'
+        tmp.write_bytes(content)
+        os.replace(tmp, target / f'{name}.jpg')
+        print(f'fetched {name}.jpg')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] != ['fetch']:
+        sys.exit(__doc__)
+    try:
+        fetch()
+    except (OSError, ValueError) as e:
+        sys.exit(f'fetch failed: {e}')
@@ -0,0 +1,149 @@
+import string
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# Upper bound on the number of materialized datasets kept in memory; the least recently
+# used ones are dropped first
+MAX_DATASETS = 64
+
+_BUILDERS = {}
+
+
+def dataset(name):
+    """Register a builder `func(rng, shape)` under `name`."""
+    def decorator(func):
+        _BUILDERS[name] = func
+        return func
+    return decorator
+
+
+@st.cache_data(max_entries=MAX_DATASETS, show_spinner=False)
+def load(name, shape, seed=0):
+    """Return the dataset `name` of the given shape, generated once per (name, shape, seed).
+
+    Every rerun and every session gets the same values, so charts stop jumping on widget clicks.
+    """
+    rng = np.random.default_rng(seed)
+    return _BUILDERS[name](rng, tuple(shape))
+
+
+# Enough for every row count the paged viewer and the downsampled charts offer, so the
+# large frames behind one example never evict those behind another
+MAX_SHARED = 8
+
+
+@st.cache_resource(max_entries=MAX_SHARED, show_spinner="Generating data...")
+def load_shared(name, shape, seed=0):
+    """Like load(), but every caller gets the same object instead of a fresh copy.
+
+    For frames too large to copy on each rerun; callers must not modify the result.
+    """
+    rng = np.random.default_rng(seed)
+    return _BUILDERS[name](rng, tuple(shape))
+
+
+@dataset('chart_data')
+def _chart_data(rng, shape):
+    return pd.DataFrame(rng.standard_normal(shape), columns=list(string.ascii_lowercase[:shape[1]]))
+
+
+@dataset('bar_data')
+def _bar_data(rng, shape):
+    rows, groups = shape
+    return pd.DataFrame({
+        "col1": list(range(rows)) * groups,
+        "col2": rng.standard_normal(rows * groups),
+        "col3": [letter for letter in string.ascii_uppercase[:groups] for _ in range(rows)],
+    })
+
+
+@dataset('scatter_data')
+def _scatter_data(rng, shape):
+    df = pd.DataFrame(rng.standard_normal(shape), columns=["col%d" % (i + 1) for i in range(shape[1])])
+    df["col%d" % (shape[1] + 1)] = rng.choice(['A', 'B', 'C'], shape[0])
+    return df
+
+
+@dataset('map_points')
+def _map_points(rng, shape):
+    rows = shape[0]
+    return pd.DataFrame({
+        "col1": rng.standard_normal(rows) / 50 + 37.76,
+        "col2": rng.standard_normal(rows) / 50 + -122.4,
+        "col3": rng.standard_normal(rows) * 100,
+        "col4": rng.random((rows, 4)).tolist(),
+    })
+
+
+@dataset('map_points_typed')
+def _map_points_typed(rng, shape):
+    # Same points as 'map_points', held as compact typed columns instead of per-row colour lists
+    rows = shape[0]
+    rgba = rng.integers(0, 256, (rows, 4), dtype=np.uint8)
+    return pd.DataFrame({
+        "lat": (rng.standard_normal(rows) / 50 + 37.76).astype(np.float32),
+        "lon": (rng.standard_normal(rows) / 50 + -122.4).astype(np.float32),
+        "radius": np.abs(rng.standard_normal(rows) * 100).astype(np.float32),
+        "r": rgba[:, 0], "g": rgba[:, 1], "b": rgba[:, 2], "a": rgba[:, 3],
+    })
+
+
+@dataset('hex_points')
+def _hex_points(rng, shape):
+    return pd.DataFrame(rng.standard_normal(shape) / [50, 50] + [37.76, -122.4], columns=['lat', 'lon'])
+
+
+@dataset('wide_frame')
+def _wide_frame(rng, shape):
+    return pd.DataFrame(rng.standard_normal(shape), columns=("col %d" % i for i in range(shape[1])))
+
+
+@dataset('long_frame')
+def _long_frame(rng, shape):
+    rows, columns = shape
+    df = pd.DataFrame({"id": np.arange(rows, dtype=np.int64),
+                       "group": pd.Categorical.from_codes(rng.integers(0, 8, rows), list("ABCDEFGH"))})
+    for i in range(columns - 2):
+        df["value %d" % i] = rng.standard_normal(rows, dtype=np.float32)
+    return df
+
+
+@dataset('app_stats')
+def _app_stats(rng, shape):
+    rows, days = shape
+    names = (["Roadmap", "Extras", "Issues"] + ["App %d" % i for i in range(4, rows + 1)])[:rows]
+    return pd.DataFrame({
+        "name": names,
+        "url": ["https://%s.streamlit.app" % name.lower().replace(" ", "-") for name in names],
+        "stars": rng.integers(0, 1000, rows, endpoint=True),
+        "views_history": rng.integers(0, 5000, (rows, days), endpoint=True).tolist(),
+    })
+
+
+@dataset('commands')
+def _commands(rng, shape):
+    # Fixed content; registered so the editor demo gets one cached frame instead of a rebuild per rerun
+    return pd.DataFrame(
+        [
+            {"command": "st.selectbox", "rating": 4, "is_widget": True},
+            {"command": "st.balloons", "rating": 5, "is_widget": False},
+            {"command": "st.time_input", "rating": 3, "is_widget": True},
+        ]
+    ).iloc[:shape[0], :shape[1]]
+
+
+@dataset('random_walk')
+def _random_walk(rng, shape):
+    steps = rng.standard_normal(shape, dtype=np.float32)
+    index = pd.date_range('2024-01-01', periods=shape[0], freq='s', name='time')
+    return pd.DataFrame(steps.cumsum(axis=0), index=index, columns=list(string.ascii_lowercase[:shape[1]]))
+
+
+@dataset('normal_sample')
+def _normal_sample(rng, shape):
+    return rng.normal(1, 1, size=shape)
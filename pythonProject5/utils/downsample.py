@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+import streamlit as st
+
+from utils import datasets
+from utils.lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Width in pixels the downsampled charts are drawn at, and so the number of points they need
+CHART_WIDTH = 700
+
+# Upper bound on the number of (series, width, range) views kept in memory
+MAX_VIEWS = 32
+
+
+def lttb(y, n_out):
+    """Indices of `n_out` points of `y` picked by Largest-Triangle-Three-Buckets.
+
+    Points are assumed evenly spaced. The average of every bucket is computed in one
+    pass; the selection itself depends on the previous pick, so it walks the buckets
+    in order but scores all points of a bucket at once.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    lengths = np.diff(edges)
+    mean_x = edges[:-1] + (lengths - 1) / 2
+    mean_y = np.add.reduceat(y, edges[:-1], dtype=np.float64) / lengths
+    # Each bucket is scored against the average of the next one; the last against the final point
+    next_x = np.append(mean_x[1:], n - 1)
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        xs = np.arange(lo, hi)
+        area = np.abs((a - next_x[i]) * (y[lo:hi] - y[a]) - (a - xs) * (next_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def _first_per_bucket(mask, bucket):
+    hits = np.flatnonzero(mask)
+    _, first = np.unique(bucket[hits], return_index=True)
+    return hits[first]
+
+
+def min_max(y, n_out):
+    """Indices of the minimum and maximum of each of `n_out // 2` equal buckets of `y`.
+
+    Keeps every spike, at the price of a less faithful shape between them than LTTB.
+    """
+    n = len(y)
+    buckets = n_out // 2
+    if n_out >= n or buckets < 1:
+        return np.arange(n)
+
+    starts = np.linspace(0, n, buckets + 1).astype(np.int64)[:-1]
+    lengths = np.diff(np.append(starts, n))
+    bucket = np.repeat(np.arange(buckets, dtype=np.int32), lengths)
+    low = _first_per_bucket(y == np.repeat(np.minimum.reduceat(y, starts), lengths), bucket)
+    high = _first_per_bucket(y == np.repeat(np.maximum.reduceat(y, starts), lengths), bucket)
+    return np.unique(np.concatenate([low, high, [0, n - 1]]))
+
+
+METHODS = {'lttb': lttb, 'min_max': min_max}
+METHOD_LABELS = {'lttb': 'LTTB', 'min_max': 'Min/max'}
+
+
+@st.cache_data(max_entries=MAX_VIEWS, show_spinner=False)
+def downsample(name, shape, seed, width, start, stop, method='lttb'):
+    """Rows `start:stop` of a shared dataset reduced to about `width` points per column.
+
+    Each column is downsampled on its own and the rows any of them needs are kept, so
+    a frame of k series yields at most k * width rows.
+    """
+    frame = datasets.load_shared(name, shape, seed).iloc[start:stop]
+    keep = np.unique(np.concatenate([METHODS[method](frame[column].to_numpy(), width) for column in frame]))
+    return frame.iloc[keep]
+
+
+def downsampled_chart(chart, name, shape, seed=0, width=CHART_WIDTH, key='downsampled'):
+    """Draw `chart` (st.line_chart, st.area_chart) over a time-indexed dataset of any length.
+
+    Only about `width` points per series reach the browser, whatever the row count and
+    the range selected.
+    """
+    frame = datasets.load_shared(name, shape, seed)
+    index = frame.index
+
+    col1, col2 = st.columns([1, 2])
+    method = col1.radio('Downsampling', list(METHODS), format_func=METHOD_LABELS.get, horizontal=True,
+                        key=f'{key}_method')
+    first, last = index[0].to_pydatetime(), index[-1].to_pydatetime()
+    low, high = col2.slider('Range', first, last, (first, last), step=timedelta(seconds=max(1, len(index) // 1000)),
+                            format='MM-DD HH:mm', key=f'{key}_range')
+    start, stop = index.searchsorted(low), index.searchsorted(high, side='right')
+
+    view = downsample(name, shape, seed, width, int(start), int(stop), method)
+    chart(view, width=width)
+    st.caption(f'{len(view):,} of {stop - start:,} points sent ({len(frame):,} in the series)')
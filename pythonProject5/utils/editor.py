@@ -0,0 +1,121 @@
+import heapq
+import math
+
+import streamlit as st
+
+
+def _number(value):
+    """`value` as a float, or None for empty cells."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+class EditAggregates:
+    """Count, sum and argmax of one column, kept current from st.data_editor's edit deltas.
+
+    The editor keeps its edits in session state as {"edited_rows": {position: {column:
+    value}}, "added_rows": [row, ...], "deleted_rows": [position, ...]}. update() applies
+    only the rows whose entry differs from the last delta it saw, so an edit costs time
+    proportional to the edited rows, never to the table. The argmax is a max-heap with
+    lazy deletion and breaks ties by row order, like idxmax().
+    """
+
+    def __init__(self, data, value_column, label_column):
+        self.value_column = value_column
+        self.label_column = label_column
+        self._base_values = [_number(v) for v in data[value_column]]
+        self._base_labels = list(data[label_column])
+        self._values = {}
+        self._labels = {}
+        self._edits = {}
+        self._added = []
+        self._deleted = set()
+        self._heap = []
+        self.count = 0
+        self.total = 0.0
+        for row, value in enumerate(self._base_values):
+            self._set(row, value)
+
+    def _set(self, row, value):
+        old = self._values.get(row)
+        if old is not None:
+            self.count -= 1
+            self.total -= old
+        if value is None:
+            self._values.pop(row, None)
+            return
+        self._values[row] = value
+        self.count += 1
+        self.total += value
+        heapq.heappush(self._heap, (-value, row))
+
+    def _label(self, row):
+        if row in self._labels:
+            return self._labels[row]
+        return self._base_labels[row] if row < len(self._base_labels) else None
+
+    def _apply_base_row(self, row, edit):
+        if edit is None or self.value_column not in edit:
+            value = self._base_values[row]
+        else:
+            value = _number(edit[self.value_column])
+        if edit is not None and self.label_column in edit:
+            self._labels[row] = edit[self.label_column]
+        else:
+            self._labels.pop(row, None)
+        if row not in self._deleted:
+            self._set(row, value)
+
+    def update(self, delta):
+        edits = delta.get('edited_rows', {})
+        for row in self._edits.keys() - edits.keys():
+            self._apply_base_row(row, None)
+        for row, edit in edits.items():
+            if self._edits.get(row) != edit:
+                self._apply_base_row(row, edit)
+        self._edits = {row: dict(edit) for row, edit in edits.items()}
+
+        deleted = set(delta.get('deleted_rows', []))
+        for row in deleted - self._deleted:
+            self._set(row, None)
+        restored, self._deleted = self._deleted - deleted, deleted
+        for row in restored:
+            self._apply_base_row(row, self._edits.get(row))
+
+        added = delta.get('added_rows', [])
+        first_added = len(self._base_values)
+        for i in range(max(len(added), len(self._added))):
+            new = added[i] if i < len(added) else None
+            if i < len(self._added) and new == self._added[i]:
+                continue
+            row = first_added + i
+            self._set(row, None if new is None else _number(new.get(self.value_column)))
+            self._labels[row] = None if new is None else new.get(self.label_column)
+        self._added = [dict(row) for row in added]
+
+    @property
+    def argmax_label(self):
+        """Label of the row with the largest value, or None when the column is empty."""
+        while self._heap:
+            value, row = self._heap[0]
+            if self._values.get(row) == -value:
+                return self._label(row)
+            heapq.heappop(self._heap)
+        return None
+
+
+def data_editor(data, key, value_column, label_column, **kwargs):
+    """st.data_editor that also returns EditAggregates of `value_column`.
+
+    The aggregates live in session state next to the editor, so each rerun only
+    applies the new edits instead of rescanning the edited frame.
+    """
+    edited = st.data_editor(data, key=key, **kwargs)
+    aggregates_key = f'_{key}_aggregates'
+    if aggregates_key not in st.session_state:
+        st.session_state[aggregates_key] = EditAggregates(data, value_column, label_column)
+    aggregates = st.session_state[aggregates_key]
+    aggregates.update(st.session_state[key])
+    return edited, aggregates
@@ -0,0 +1,34 @@
+import io
+
+import streamlit as st
+
+# Rendered PNGs kept in memory; the least recently used ones are dropped first
+MAX_FIGURES = 32
+
+
+def render_png(draw, style='default', dpi=100):
+    """Draw a figure with `draw(ax)` on the Agg backend and return it as PNG bytes.
+
+    The figure is built with matplotlib's object API, so it never enters pyplot's
+    global registry, and it is cleared as soon as the PNG is written.
+    """
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    with matplotlib.style.context(style):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        try:
+            draw(fig.subplots())
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=dpi)
+        finally:
+            fig.clear()
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=MAX_FIGURES, show_spinner=False)
+def histogram_png(data, bins=20, style='default'):
+    """PNG of a histogram of `data`, drawn once per (data, bins, style)."""
+    return render_png(lambda ax: ax.hist(data, bins=bins), style)
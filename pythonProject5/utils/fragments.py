@@ -0,0 +1,21 @@
+import functools
+
+import streamlit as st
+
+from utils.perf import timed
+
+
+def example(func):
+    """Turn an example block into a fragment that reruns on its own.
+
+    Interacting with a widget inside the example reruns only `func`, not the whole
+    section. The time of the last run is kept under the function name for the
+    performance panel.
+    """
+    @st.fragment
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
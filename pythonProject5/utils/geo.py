@@ -0,0 +1,148 @@
+import functools
+import json
+
+import streamlit as st
+
+from utils import datasets
+from utils.lazy import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+pdk = lazy_import('pydeck')
+
+EARTH_RADIUS = 6_371_008.8
+SQRT3 = 3 ** 0.5
+
+# Each point goes out as ~55 bytes of compact JSON, so above this many the browser gets
+# hexagons of CELL_RESOLUTION metres instead
+MAX_SCATTER_POINTS = 20_000
+CELL_RESOLUTION = 100
+
+
+def _project(lat, lon, lat0):
+    """Equirectangular projection to metres around latitude `lat0`; accurate at city scale."""
+    x = EARTH_RADIUS * np.radians(lon) * np.cos(np.radians(lat0))
+    y = EARTH_RADIUS * np.radians(lat)
+    return x, y
+
+
+def _unproject(x, y, lat0):
+    lon = np.degrees(x / (EARTH_RADIUS * np.cos(np.radians(lat0))))
+    lat = np.degrees(y / EARTH_RADIUS)
+    return lat, lon
+
+
+def _count_cells(i, j):
+    """Count points per integer cell (i, j); returns unique i, j and their counts."""
+    i0, j0 = i.min(), j.min()
+    span = int(j.max() - j0) + 1
+    keys, counts = np.unique((i - i0) * span + (j - j0), return_counts=True)
+    return keys // span + i0, keys % span + j0, counts
+
+
+def hex_bin(lat, lon, radius):
+    """Aggregate points into pointy-top hexagons of circumradius `radius` metres.
+
+    Returns a frame with one row per non-empty cell: centre lat/lon and point count.
+    """
+    lat0 = float(np.mean(lat))
+    x, y = _project(lat, lon, lat0)
+    q = (SQRT3 / 3 * x - y / 3) / radius
+    r = (2 / 3 * y) / radius
+
+    # Round fractional axial coordinates to the nearest hexagon via cube coordinates
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+
+    cq, cr, counts = _count_cells(rq.astype(np.int64), rr.astype(np.int64))
+    cell_lat, cell_lon = _unproject(radius * SQRT3 * (cq + cr / 2), radius * 1.5 * cr, lat0)
+    return pd.DataFrame({'lat': cell_lat, 'lon': cell_lon, 'count': counts})
+
+
+def grid_bin(lat, lon, size):
+    """Aggregate points into square cells of `size` metres; same output as hex_bin."""
+    lat0 = float(np.mean(lat))
+    x, y = _project(lat, lon, lat0)
+    ci, cj, counts = _count_cells(np.floor(x / size).astype(np.int64), np.floor(y / size).astype(np.int64))
+    cell_lat, cell_lon = _unproject((ci + 0.5) * size, (cj + 0.5) * size, lat0)
+    return pd.DataFrame({'lat': cell_lat, 'lon': cell_lon, 'count': counts})
+
+
+BINNERS = {'hex': hex_bin, 'grid': grid_bin}
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def aggregate(name, shape, seed=0, method='hex', resolution=200):
+    """Bin a registered lat/lon dataset on the server, once per (dataset, method, resolution).
+
+    Only the cells reach the browser, so the payload depends on the area covered and
+    `resolution` (metres), not on the number of points. `weight` is the count scaled to 0..1.
+    """
+    points = datasets.load(name, shape, seed)
+    cells = BINNERS[method](points['lat'].to_numpy(), points['lon'].to_numpy(), resolution)
+    cells['weight'] = (cells['count'] / cells['count'].max()).round(3)
+    # Metre-level precision is plenty for a cell centre and keeps the JSON payload small
+    return cells.round({'lat': 5, 'lon': 5})
+
+
+@functools.cache
+def _compact_deck():
+    """pdk.Deck serialized without whitespace; pydeck's own to_json puts every value of every row on its own line."""
+    from pydeck.bindings.json_tools import default_serialize
+
+    class CompactDeck(pdk.Deck):
+        def to_json(self):
+            return json.dumps(self, sort_keys=True, default=default_serialize, separators=(',', ':'))
+
+    return CompactDeck
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def scatter_rows(name, shape, seed=0):
+    """Rows of a 'map_points_typed'-style dataset in the shape the ScatterplotLayer reads.
+
+    Position `p` is rounded to 5 decimals (about a metre), colour `c` is the four uint8
+    channels and radius `r` is whole metres, which is all a point on a city map can show.
+    """
+    points = datasets.load(name, shape, seed)
+    position = np.round(points[['lon', 'lat']].to_numpy(dtype='float64'), 5).tolist()
+    colour = points[['r', 'g', 'b', 'a']].to_numpy().tolist()
+    radius = np.rint(points['radius'].to_numpy()).astype(int).tolist()
+    return [{'p': p, 'c': c, 'r': r} for p, c, r in zip(position, colour, radius)]
+
+
+def scatter_deck(name, shape, seed=0, **deck_kwargs):
+    """pydeck Deck of a registered 'map_points_typed'-style dataset, serialized compactly.
+
+    Up to MAX_SCATTER_POINTS rows are drawn as points coloured and sized by their typed
+    columns; larger datasets are binned on the server and drawn as cells shaded by count.
+    """
+    if shape[0] <= MAX_SCATTER_POINTS:
+        layer = pdk.Layer(
+            'ScatterplotLayer',
+            id=f'scatter-{name}',
+            data=scatter_rows(name, shape, seed),
+            get_position='p',
+            get_fill_color='c',
+            get_radius='r',
+            radius_min_pixels=1,
+        )
+    else:
+        layer = pdk.Layer(
+            'ColumnLayer',
+            id=f'cells-{name}',
+            data=aggregate(name, shape, seed, method='hex', resolution=CELL_RESOLUTION),
+            get_position='[lon, lat]',
+            radius=CELL_RESOLUTION * 0.9,
+            disk_resolution=6,
+            extruded=False,
+            get_fill_color='[255, 140, 0, 40 + 215 * weight]',
+            pickable=True,
+        )
+        deck_kwargs.setdefault('tooltip', {'text': '{count} points'})
+    return _compact_deck()(layers=[layer], **deck_kwargs)
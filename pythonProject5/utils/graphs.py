@@ -0,0 +1,67 @@
+import hashlib
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+
+graphviz = lazy_import('graphviz')
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'graphviz'
+
+# Graphs with at least this many edges are laid out on the server by default; smaller
+# ones are cheap enough for the browser
+LARGE_GRAPH_EDGES = 500
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def dot_source(edges, directed=True):
+    """DOT source of a graph given as a sequence of (tail, head) pairs, built once per edge list."""
+    graph = graphviz.Digraph() if directed else graphviz.Graph()
+    graph.edges(edges)
+    return graph.source
+
+
+def source_hash(source):
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _layout_svg(digest, source):
+    path = CACHE_DIR / f'{digest}.svg'
+    if path.exists():
+        return path.read_text()
+
+    svg = graphviz.Source(source).pipe(format='svg', encoding='utf-8')
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(svg)
+    os.replace(tmp, path)
+    return svg
+
+
+def layout_svg(source):
+    """Lay `source` out to SVG with the `dot` executable, once per distinct DOT source.
+
+    The SVG is stored on disk under its source hash, so the layout survives restarts and
+    is shared by every worker that uses the same cache directory.
+    """
+    return _layout_svg(source_hash(source), source)
+
+
+def graphviz_chart(source, prelayout=None):
+    """st.graphviz_chart that can hand the browser a finished layout instead of DOT.
+
+    With `prelayout` left as None, graphs of LARGE_GRAPH_EDGES edges or more are laid
+    out on the server. Without a Graphviz installation the browser does the layout.
+    """
+    if prelayout is None:
+        prelayout = source.count('->') + source.count('--') >= LARGE_GRAPH_EDGES
+    if prelayout:
+        try:
+            st.image(layout_svg(source))
+            return
+        except graphviz.ExecutableNotFound:
+            pass
+    st.graphviz_chart(source)
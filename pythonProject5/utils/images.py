@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from utils import assets
+from utils.lazy import lazy_import
+
+Image = lazy_import('PIL.Image')
+features = lazy_import('PIL.features')
+
+# Widths variants are made at; a request is rounded up to the next one
+WIDTHS = [320, 480, 640, 960, 1280, 1920]
+# Roughly the widest the main area gets with layout='wide', and the pixel density variants are made for
+PAGE_WIDTH = 1200
+PIXEL_RATIO = 1.5
+QUALITY = 80
+
+
+def bucket(css_width):
+    """Smallest variant width covering `css_width` CSS pixels at PIXEL_RATIO."""
+    needed = css_width * PIXEL_RATIO
+    return next((width for width in WIDTHS if width >= needed), WIDTHS[-1])
+
+
+def _format():
+    return ('WEBP', 'webp') if features.check('webp') else ('JPEG', 'jpg')
+
+
+@st.cache_data(show_spinner=False)
+def _variant(path, mtime_ns, width):
+    path = Path(path)
+    fmt, ext = _format()
+    target = assets.STATIC_DIR / f'{path.stem}.{assets.content_hash(path)[:12]}.w{width}.{ext}'
+    if target.exists():
+        return target
+    with Image.open(path) as image:
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        if fmt == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+        image.save(tmp, fmt, quality=QUALITY)
+    os.replace(tmp, target)
+    return target
+
+
+def variant(path, width):
+    """A copy of the image at `path`, at most `width` pixels wide and recompressed (WebP if available).
+
+    Built once on disk under a name made of the source's content hash and the width, and
+    looked up by path, modification time and width afterwards.
+    """
+    path = Path(path)
+    return _variant(str(path), path.stat().st_mtime_ns, width)
+
+
+def source(name, columns=1):
+    """What to pass to st.image for asset `name` shown in one of `columns` equal columns."""
+    url = assets.source(name)
+    if url.startswith(('http://', 'https://')):
+        return url
+    target = variant(assets.path(name), bucket(PAGE_WIDTH / columns))
+    if assets.static_serving():
+        return assets.STATIC_URL + target.name
+    return str(target)
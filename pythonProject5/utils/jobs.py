@@ -0,0 +1,153 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+MAX_WORKERS = 4
+# Jobs queued or running at once across all sessions; submitting more raises QueueFull
+MAX_PENDING = 32
+# Finished jobs are forgotten after this long, whether or not their session collected them
+FINISHED_TTL = 600
+POLL_INTERVAL = 0.5
+
+SESSION_KEY = '_job_ids'
+
+
+class QueueFull(RuntimeError):
+    pass
+
+
+class Job:
+    """A unit of background work; the function running it reports progress through update()."""
+
+    def __init__(self, name):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.state = 'queued'
+        self.progress = 0.0
+        self.status = 'Waiting for a worker...'
+        self.result = None
+        self.error = None
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return self.state in ('complete', 'error')
+
+    def update(self, progress=None, status=None):
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+        if status is not None:
+            self.status = status
+
+
+class JobRunner:
+    """Bounded thread pool shared by all sessions, with jobs looked up by id."""
+
+    def __init__(self, max_workers=MAX_WORKERS, max_pending=MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name, func, *args, **kwargs):
+        """Run `func(job, *args, **kwargs)` on a worker and return its Job straight away."""
+        if not self._slots.acquire(blocking=False):
+            raise QueueFull(f'{MAX_PENDING} jobs are already queued or running')
+        job = Job(name)
+        with self._lock:
+            self._expire()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def forget(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _run(self, job, func, args, kwargs):
+        job.state = 'running'
+        job.update(status='Running...')
+        try:
+            job.result = func(job, *args, **kwargs)
+            job.update(1.0, 'Done')
+            job.state = 'complete'
+        except Exception as e:
+            job.error = e
+            job.update(status=f'Failed: {e}')
+            job.state = 'error'
+        finally:
+            job.finished_at = time.monotonic()
+            self._slots.release()
+
+    def _expire(self):
+        now = time.monotonic()
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and now - job.finished_at > FINISHED_TTL]:
+            del self._jobs[job_id]
+
+
+@st.cache_resource
+def runner():
+    return JobRunner()
+
+
+def submit(name, func, *args, **kwargs):
+    """Start a background job for this session; its id is kept in session state."""
+    job = runner().submit(name, func, *args, **kwargs)
+    st.session_state.setdefault(SESSION_KEY, []).append(job.id)
+    return job
+
+
+def session_jobs():
+    """This session's jobs that the runner still knows about, oldest first."""
+    jobs = [runner().get(job_id) for job_id in st.session_state.get(SESSION_KEY, [])]
+    st.session_state[SESSION_KEY] = [job.id for job in jobs if job is not None]
+    return [job for job in jobs if job is not None]
+
+
+def clear_finished():
+    for job in session_jobs():
+        if job.done:
+            runner().forget(job.id)
+    session_jobs()
+
+
+def _draw_jobs(jobs):
+    for job in jobs:
+        with st.container(border=True):
+            st.markdown(f'**{job.name}**')
+            st.progress(job.progress, text=job.status)
+            if job.state == 'complete':
+                st.write(job.result)
+            elif job.state == 'error':
+                st.error(job.status)
+
+
+def job_panel():
+    """Show this session's jobs; while any is unfinished, the panel reruns on its own every POLL_INTERVAL.
+
+    Only the panel reruns, so the script thread is busy for a few milliseconds per poll
+    instead of for the length of the job.
+    """
+    jobs = session_jobs()
+    if not any(not job.done for job in jobs):
+        _draw_jobs(jobs)
+        return None
+
+    @st.fragment(run_every=POLL_INTERVAL)
+    def poll():
+        current = session_jobs()
+        _draw_jobs(current)
+        if all(job.done for job in current):
+            # Rerun the page once so the panel is drawn again without a timer
+            st.rerun()
+
+    poll()
+    return None
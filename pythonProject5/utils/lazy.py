@@ -0,0 +1,30 @@
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """Return `name` as a module that is only imported once something uses it.
+
+    Sections that never touch the module never pay for importing it, so a rerun of
+    "Text elements" does not load pandas, altair, matplotlib, pydeck or graphviz.
+    """
+    return LazyModule(name)
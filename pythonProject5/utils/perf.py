@@ -0,0 +1,106 @@
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import streamlit as st
+
+from utils import warmup
+
+# Open any page with ?perf=1 to show the panel
+QUERY_PARAM = 'perf'
+
+SECTIONS_KEY = '_section_timings'
+EXAMPLES_KEY = '_example_timings'
+PEAK_KEY = '_tracemalloc_peak'
+# Seconds between redraws of the panel
+PANEL_REFRESH = 2
+
+_tracing_lock = threading.Lock()
+_tracing_runs = 0
+
+
+def enabled():
+    return st.query_params.get(QUERY_PARAM) == '1'
+
+
+@contextmanager
+def timed(name, key=EXAMPLES_KEY):
+    """Record how long the `with` body took under `name` in st.session_state[key]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        st.session_state.setdefault(key, {})[name] = time.perf_counter() - start
+
+
+def timed_section(func):
+    """Record the run time of a page section such as `Chart_elements` or `cs_body`."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed(func.__name__, key=SECTIONS_KEY):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def measured_run():
+    """Time and trace the page body, then show the performance panel in the sidebar.
+
+    Tracing stops however the body ends, including st.rerun, st.stop, st.switch_page or
+    an exception; the panel is only drawn when the body completes.
+    """
+    if not enabled():
+        yield
+        return
+    st.session_state[SECTIONS_KEY] = {}
+    st.session_state[EXAMPLES_KEY] = {}
+    _start_tracing()
+    try:
+        yield
+    finally:
+        st.session_state[PEAK_KEY] = _stop_tracing()
+    with st.sidebar:
+        _panel()
+
+
+def _start_tracing():
+    global _tracing_runs
+
+    with _tracing_lock:
+        if _tracing_runs == 0:
+            tracemalloc.start()
+        _tracing_runs += 1
+        tracemalloc.reset_peak()
+
+
+def _stop_tracing():
+    """Peak traced since the last reset; tracing stops with the last run that needed it."""
+    global _tracing_runs
+
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        _tracing_runs = max(_tracing_runs - 1, 0)
+        if _tracing_runs == 0:
+            tracemalloc.stop()
+    return peak
+
+
+# Redrawn on a timer so timings recorded by fragment reruns of the examples show up too
+@st.fragment(run_every=PANEL_REFRESH)
+def _panel():
+    with st.expander('Performance', expanded=True):
+        peak = st.session_state.get(PEAK_KEY)
+        if peak is not None:
+            # tracemalloc is process wide, so concurrent reruns on this worker add to the peak
+            st.metric('tracemalloc peak', f'{peak / 1024:,.0f} KiB', help='Of the last full run')
+        if 'total' in warmup.report:
+            st.caption(f"Process warm-up took {warmup.report['total']:.2f} s")
+        for title, key in (('Sections', SECTIONS_KEY), ('Examples', EXAMPLES_KEY)):
+            timings = st.session_state.get(key)
+            if timings:
+                st.markdown(f'**{title}**')
+                st.table({'ms': {name: round(seconds * 1000, 1) for name, seconds in
+                                 sorted(timings.items(), key=lambda item: -item[1])}})
@@ -0,0 +1,163 @@
+import ast
+import bisect
+import importlib.util
+import re
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+GENERAL_FEATURES_PAGE = 'pages/General_Features_🎑.py'
+CHEAT_SHEET_PAGE = 'pages/Docs_Cheat_Sheet_ 💻.py'
+CHEAT_SHEET = 'Cheat sheet'
+
+# Session-state key read by the General Features page to open a section
+TARGET_KEY = 'search_target'
+MAX_RESULTS = 8
+
+Snippet = namedtuple('Snippet', 'page section heading text')
+
+_TOKEN = re.compile(r'[a-z0-9_]+(?:\.[a-z0-9_]+)*')
+_HEADING_CALLS = {'header', 'subheader'}
+_TEXT_CALLS = _HEADING_CALLS | {'title', 'markdown', 'caption', 'text', 'code', 'latex', 'write'}
+
+
+def tokens(text):
+    """Lower-case identifiers and words, plus each part of dotted names (`st.data_editor`)."""
+    found = set()
+    for token in _TOKEN.findall(text.lower()):
+        found.add(token)
+        if '.' in token:
+            found.update(token.split('.'))
+    return found
+
+
+def _heading(text):
+    line = text.strip().splitlines()[0] if text.strip() else ''
+    if line.startswith('#'):
+        return line.strip('#* ') or None
+    return None
+
+
+def _snippets(path, page, section):
+    """Every string written by a text call (markdown, code, ...) in `path`, labelled with its heading.
+
+    Read from the source, so nothing is imported or rendered. Within a function, a
+    header/subheader call or a markdown string starting with `#` sets the heading; before
+    that, `foo_example` functions are labelled `foo`.
+    """
+    tree = ast.parse(Path(path).read_text(encoding='utf-8'))
+    for func in tree.body:
+        if not isinstance(func, ast.FunctionDef):
+            continue
+        heading = func.name[:-len('_example')].replace('_', ' ') if func.name.endswith('_example') else None
+        calls = sorted((node for node in ast.walk(func) if isinstance(node, ast.Call)),
+                       key=lambda node: (node.lineno, node.col_offset))
+        for call in calls:
+            name = getattr(call.func, 'attr', None)
+            if name not in _TEXT_CALLS:
+                continue
+            for arg in call.args:
+                if not (isinstance(arg, ast.Constant) and isinstance(arg.value, str) and arg.value.strip()):
+                    continue
+                if name in _HEADING_CALLS:
+                    heading = arg.value.strip()
+                    continue
+                if name == 'markdown':
+                    heading = _heading(arg.value) or heading
+                yield Snippet(page, section, heading, arg.value)
+
+
+def _sources():
+    yield CHEAT_SHEET_PAGE, None, importlib.util.find_spec('utils.cheatsheet').origin
+    import sections
+
+    for title, module in sections.REGISTRY.items():
+        yield GENERAL_FEATURES_PAGE, title, importlib.util.find_spec(f'sections.{module}').origin
+
+
+class SearchIndex:
+    """Inverted index of snippets with prefix lookup over a sorted vocabulary.
+
+    A token in a snippet's heading weighs twice as much as one in its text.
+    """
+
+    def __init__(self, snippets):
+        self.snippets = list(snippets)
+        postings = {}
+        for i, snippet in enumerate(self.snippets):
+            text, heading = tokens(snippet.text), tokens(snippet.heading or '')
+            for token in text | heading:
+                postings.setdefault(token, []).append((i, (token in text) + 2 * (token in heading)))
+        self.vocabulary = sorted(postings)
+        self._postings = [postings[token] for token in self.vocabulary]
+
+    def _matching(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        stop = bisect.bisect_left(self.vocabulary, prefix + '\uffff', lo=start)
+        matches = {}
+        for postings in self._postings[start:stop]:
+            for i, weight in postings:
+                matches[i] = matches.get(i, 0) + weight
+        return matches
+
+    def search(self, query, limit=MAX_RESULTS):
+        """Snippets containing a token starting with every term of `query`, best first, one per heading."""
+        terms = _TOKEN.findall(query.lower())
+        if not terms:
+            return []
+        scores = self._matching(terms[0])
+        for term in terms[1:]:
+            matches = self._matching(term)
+            scores = {i: score + matches[i] for i, score in scores.items() if i in matches}
+        results, seen = [], set()
+        for i in sorted(scores, key=lambda i: (-scores[i], i)):
+            snippet = self.snippets[i]
+            if (snippet.page, snippet.section, snippet.heading) not in seen:
+                seen.add((snippet.page, snippet.section, snippet.heading))
+                results.append(snippet)
+                if len(results) == limit:
+                    break
+        return results
+
+
+@st.cache_resource(show_spinner=False)
+def index():
+    snippets = []
+    for page, section, path in _sources():
+        snippets.extend(_snippets(path, page, section))
+    return SearchIndex(snippets)
+
+
+def _excerpt(snippet, query, width=60):
+    terms = _TOKEN.findall(query.lower())
+    lines = [line.strip(' >.') for line in snippet.text.strip().splitlines() if line.strip(' >.')]
+    line = next((line for line in lines if all(term in line.lower() for term in terms)),
+                next((line for line in lines if any(term in line.lower() for term in terms)), lines[0] if lines else ''))
+    return line if len(line) <= width else line[:width - 1] + '…'
+
+
+def search_box():
+    """Sidebar search over the cheat sheet and the API reference sections."""
+    query = st.sidebar.text_input('Search the API', key='search_query', placeholder='e.g. st.data_editor')
+    if not query:
+        return None
+
+    searcher = index()
+    start = time.perf_counter()
+    results = searcher.search(query)
+    elapsed = time.perf_counter() - start
+    if not results:
+        st.sidebar.caption('No matches')
+        return None
+    st.sidebar.caption(f'{len(results)} matches in {elapsed * 1000:.2f} ms')
+    for i, snippet in enumerate(results):
+        where = ' › '.join(filter(None, [snippet.section or CHEAT_SHEET, snippet.heading]))
+        excerpt = _excerpt(snippet, query).replace('`', "'")
+        if st.sidebar.button(f'{where}  \n`{excerpt}`', key=f'search_result_{i}', use_container_width=True):
+            if snippet.section is not None:
+                st.session_state[TARGET_KEY] = snippet.section
+            st.switch_page(snippet.page)
+
+    return None
@@ -0,0 +1,172 @@
+import collections
+import threading
+import time
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# Rows kept per session, and so the most a live chart shows before it starts over
+CAPACITY = 5_000
+TICK = 0.1
+# A producer nobody has read from for this long stops on its own
+IDLE_TIMEOUT = 5.0
+
+# add_rows() is gone from recent Streamlit releases; there the chart is redrawn in place instead,
+# less often and from the buffer averaged down to REDRAW_POINTS rows, since every redraw
+# sends the whole chart again (about 85 bytes a point)
+HAS_ADD_ROWS = hasattr(st.delta_generator.DeltaGenerator, 'add_rows')
+REDRAW_POINTS = 500
+REDRAW_TICK = 0.5
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of timestamped rows; once full, new rows overwrite the oldest.
+
+    Rows are numbered by the order they arrived in, so a reader can ask for everything
+    after the last row it saw.
+    """
+
+    def __init__(self, capacity, width):
+        self.capacity = capacity
+        self.width = width
+        self.count = 0
+        self._rows = np.zeros((capacity, width), dtype=np.float32)
+        self._stamps = np.zeros(capacity)
+        self._lock = threading.Lock()
+
+    def extend(self, rows, stamps):
+        with self._lock:
+            n = len(rows)
+            keep = min(n, self.capacity)
+            positions = np.arange(self.count + n - keep, self.count + n) % self.capacity
+            self._rows[positions] = rows[-keep:]
+            self._stamps[positions] = stamps[-keep:]
+            self.count += n
+
+    def since(self, seq):
+        """Rows numbered `seq` and later that are still held, their numbers and timestamps."""
+        with self._lock:
+            start = max(seq, self.count - self.capacity)
+            numbers = np.arange(start, self.count)
+            positions = numbers % self.capacity
+            return self._rows[positions], numbers, self._stamps[positions]
+
+
+class Producer(threading.Thread):
+    """Appends a random walk to a ring buffer at `rate` rows per second until stopped or left unread."""
+
+    def __init__(self, buffer, rate, seed=0):
+        super().__init__(name='live-producer', daemon=True)
+        self.buffer = buffer
+        self.rate = rate
+        self.last_read = time.monotonic()
+        self._stop_event = threading.Event()
+        self._rng = np.random.default_rng(seed)
+
+    def touch(self):
+        self.last_read = time.monotonic()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        start = time.monotonic()
+        produced = 0
+        level = np.zeros(self.buffer.width, dtype=np.float32)
+        while not self._stop_event.is_set() and time.monotonic() - self.last_read < IDLE_TIMEOUT:
+            now = time.monotonic()
+            due = int((now - start) * self.rate) - produced
+            if due > 0:
+                rows = level + self._rng.standard_normal((due, len(level)), dtype=np.float32).cumsum(axis=0)
+                level = rows[-1]
+                self.buffer.extend(rows, np.full(due, now))
+                produced += due
+            self._stop_event.wait(TICK / 10)
+
+
+def producer(key, rate, width=3):
+    """This session's producer for `key`, restarted if the rate changed or it stopped."""
+    state_key = f'_{key}_producer'
+    current = st.session_state.get(state_key)
+    if current is None or current.rate != rate or not current.is_alive():
+        if current is not None:
+            current.stop()
+        current = Producer(RingBuffer(CAPACITY, width), rate)
+        current.start()
+        st.session_state[state_key] = current
+    current.touch()
+    return current
+
+
+def downsample(rows, numbers, points):
+    """At most `points` rows: the mean of each run of consecutive rows, numbered by its last row."""
+    step = -(-len(rows) // points)
+    if step <= 1:
+        return rows, numbers
+    edges = np.arange(0, len(rows), step)
+    sizes = np.diff(np.append(edges, len(rows)))
+    means = np.add.reduceat(rows, edges) / sizes[:, None]
+    return means.astype(rows.dtype), numbers[edges + sizes - 1]
+
+
+def live_chart(key, rate, duration, chart=st.line_chart):
+    """Stream a producer into `chart` with add_rows on a fixed tick for `duration` seconds.
+
+    The server holds one ring buffer per session whatever the duration. The chart starts
+    over each time it would exceed CAPACITY rows, so the browser's copy stays bounded
+    too. Without add_rows, the buffer is averaged down to REDRAW_POINTS rows and the chart
+    redrawn every REDRAW_TICK seconds instead.
+    """
+    source = producer(key, rate)
+    columns = [f'series {i + 1}' for i in range(source.buffer.width)]
+    col1, col2, col3 = st.columns(3)
+    rate_metric, latency_metric, rows_metric = col1.empty(), col2.empty(), col3.empty()
+    placeholder = st.empty()
+
+    seq, drawn, delivered = source.buffer.count, 0, 0
+    latencies = collections.deque(maxlen=50)
+    element = None
+    tick = TICK if HAS_ADD_ROWS else REDRAW_TICK
+    start = time.monotonic()
+    next_tick = start
+    while time.monotonic() - start < duration:
+        next_tick += tick
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+        source.touch()
+        rows, numbers, stamps = source.buffer.since(seq)
+        if not len(rows):
+            continue
+        latencies.append(time.monotonic() - stamps[0])
+        if not HAS_ADD_ROWS:
+            # The rows drawn so far plus the new ones, at most the CAPACITY the buffer still holds
+            shown, shown_numbers, _ = source.buffer.since(seq - drawn)
+            shown, shown_numbers = downsample(shown, shown_numbers, REDRAW_POINTS)
+            with placeholder.container():
+                chart(pd.DataFrame(shown, index=shown_numbers, columns=columns))
+            drawn = min(drawn + len(rows), source.buffer.capacity)
+        elif element is None or drawn + len(rows) > source.buffer.capacity:
+            # Start the chart over, so the browser never keeps more than CAPACITY rows
+            with placeholder.container():
+                element = chart(pd.DataFrame(rows, index=numbers, columns=columns))
+            drawn = len(rows)
+        else:
+            element.add_rows(pd.DataFrame(rows, index=numbers, columns=columns))
+            drawn += len(rows)
+        delivered += numbers[-1] + 1 - seq
+        seq = numbers[-1] + 1
+        now = time.monotonic()
+
+        rate_metric.metric('Rows / s', f'{delivered / (now - start):,.0f}')
+        latency_metric.metric('Update latency', f'{np.median(latencies) * 1000:.0f} ms',
+                              help='Median over the last 50 ticks, from when a row was produced to when it was sent')
+        if HAS_ADD_ROWS:
+            rows_metric.metric('Rows on the chart', f'{drawn:,}')
+        else:
+            rows_metric.metric('Points per redraw', f'{len(shown):,}', help=f'The last {drawn:,} rows, averaged')
+
+    source.touch()
+    return delivered
@@ -0,0 +1,26 @@
+import streamlit as st
+
+
+def lazy_tabs(labels, key):
+    """Tab bar whose panes are plain flags, so only the selected pane's body runs.
+
+    st.tabs runs every pane on every rerun. Here the caller branches on the flags
+    instead, and hidden panes cost nothing on the server or over the websocket:
+
+        output, code = lazy_tabs(['Output', 'Code'], key='area_chart')
+        if output:
+            st.area_chart(df)
+        if code:
+            st.code(...)
+
+    The selection is kept in session state, so it survives switching sections.
+    """
+    widget_key = '_lazy_tabs_' + key
+    selected_key = '_lazy_tabs_selected_' + key
+    if st.session_state.get(widget_key) not in labels:
+        selected = st.session_state.get(selected_key)
+        st.session_state[widget_key] = selected if selected in labels else labels[0]
+
+    selected = st.radio(key, labels, key=widget_key, horizontal=True, label_visibility='collapsed')
+    st.session_state[selected_key] = selected
+    return [label == selected for label in labels]
@@ -0,0 +1,188 @@
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+CHUNK_ROWS = 50_000
+SAMPLE_ROWS = 1_000
+PREVIEW_ROWS = 20
+
+# Memory the shared cache of upload summaries may use across all sessions. A summary
+# holds a preview and counts, not the parsed table, so this is thousands of files
+UPLOAD_CACHE_BYTES = 16 * 2 ** 20
+
+
+@dataclass
+class CsvSummary:
+    name: str
+    preview: object
+    dtypes: dict
+    rows: int = 0
+    chunks: int = 0
+    errors: list = field(default_factory=list)
+    # True when the file could not be parsed at all; `errors` says why
+    failed: bool = False
+
+    @property
+    def nbytes(self):
+        preview = 0 if self.preview is None else int(self.preview.memory_usage(deep=True).sum())
+        text = sum(len(str(k)) + len(str(v)) for k, v in self.dtypes.items()) + sum(map(len, self.errors))
+        return preview + text + 512
+
+
+def infer_dtypes(file, sample_rows=SAMPLE_ROWS):
+    """Column dtypes read from the first `sample_rows` rows of a CSV file object."""
+    file.seek(0)
+    sample = pd.read_csv(file, nrows=sample_rows)
+    file.seek(0)
+    return {column: dtype if pd.api.types.is_numeric_dtype(dtype) else 'string'
+            for column, dtype in sample.dtypes.items()}
+
+
+def _nullable(dtypes):
+    # Slower to parse, but integer and boolean columns then accept missing values
+    return {column: 'Int64' if pd.api.types.is_integer_dtype(dtype) else
+            'boolean' if pd.api.types.is_bool_dtype(dtype) else dtype
+            for column, dtype in dtypes.items()}
+
+
+def _parse(file, name, dtypes, chunk_rows, preview_rows, progress):
+    file.seek(0)
+    summary = CsvSummary(name=name, preview=None, dtypes=dtypes)
+    for chunk in pd.read_csv(file, dtype=dtypes, chunksize=chunk_rows):
+        if summary.preview is None:
+            summary.preview = chunk.head(preview_rows)
+        summary.rows += len(chunk)
+        summary.chunks += 1
+        if progress is not None:
+            progress(summary)
+    return summary
+
+
+def ingest_csv(file, name=None, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS, preview_rows=PREVIEW_ROWS,
+               progress=None):
+    """Parse a CSV file object in chunks of `chunk_rows` rows and summarize it.
+
+    Only one chunk is alive at a time, so memory stays bounded by the chunk size rather
+    than the file size. `progress(summary)` is called after every chunk with the running
+    row count. If a later row does not fit the sampled dtypes, the file is parsed again,
+    first with nullable integer and boolean columns, then as text, which is noted in `errors`.
+    """
+    name = name or getattr(file, 'name', 'upload.csv')
+    try:
+        dtypes = infer_dtypes(file, sample_rows)
+    except pd.errors.EmptyDataError:
+        return CsvSummary(name=name, preview=None, dtypes={})
+    attempts = [dtypes, _nullable(dtypes)]
+    for attempt_dtypes in attempts:
+        try:
+            return _parse(file, name, attempt_dtypes, chunk_rows, preview_rows, progress)
+        except (ValueError, TypeError) as e:
+            error = e
+    summary = _parse(file, name, dict.fromkeys(dtypes, 'string'), chunk_rows, preview_rows, progress)
+    summary.errors.append(f'Sampled dtypes did not fit the whole file, parsed as text: {error}')
+    return summary
+
+
+class ParsedUploadCache:
+    """Parsed uploads shared by all sessions, keyed by content hash, bounded by bytes.
+
+    Each entry remembers which sessions use it. When a session drops a file its
+    reference goes, and entries nobody references are evicted first, least recently
+    used first; referenced entries go only if that is not enough to fit the budget.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self._entries = OrderedDict()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, digest, session):
+        with self._lock:
+            summary = self._entries.get(digest)
+            if summary is not None:
+                self._entries.move_to_end(digest)
+                self._sessions[digest].add(session)
+            return summary
+
+    def put(self, digest, summary, session):
+        with self._lock:
+            if digest not in self._entries:
+                self._entries[digest] = summary
+                self._sessions[digest] = set()
+                self.size += summary.nbytes
+            self._sessions[digest].add(session)
+            self._evict()
+
+    def release(self, session, keep=()):
+        """Drop `session`'s references to every entry not in `keep`."""
+        with self._lock:
+            for digest, sessions in self._sessions.items():
+                if digest not in keep:
+                    sessions.discard(session)
+            self._evict()
+
+    def _evict(self):
+        for referenced in (False, True):
+            for digest in list(self._entries):
+                if self.size <= self.budget:
+                    return
+                if bool(self._sessions[digest]) == referenced:
+                    self.size -= self._entries.pop(digest).nbytes
+                    del self._sessions[digest]
+
+
+@st.cache_resource
+def upload_cache():
+    return ParsedUploadCache(UPLOAD_CACHE_BYTES)
+
+
+def _session_id():
+    if '_upload_session' not in st.session_state:
+        st.session_state['_upload_session'] = uuid.uuid4().hex
+    return st.session_state['_upload_session']
+
+
+def content_hash(uploaded_file):
+    """SHA-256 of an upload's content, computed once per uploaded file per session."""
+    hashes = st.session_state.setdefault('_upload_hashes', {})
+    if uploaded_file.file_id not in hashes:
+        hashes[uploaded_file.file_id] = hashlib.sha256(uploaded_file.getbuffer()).hexdigest()
+    return hashes[uploaded_file.file_id]
+
+
+def ingest_csv_cached(uploaded_file, progress=None):
+    """ingest_csv() that parses each distinct file content once across reruns and sessions.
+
+    A file that cannot be parsed gives a summary with `failed` set instead of raising.
+    """
+    digest = content_hash(uploaded_file)
+    cache = upload_cache()
+    summary = cache.get(digest, _session_id())
+    if summary is None:
+        try:
+            summary = ingest_csv(uploaded_file, name=uploaded_file.name, progress=progress)
+        except ValueError as e:
+            # Remembered like a success, so a broken file is not parsed again on every rerun
+            summary = CsvSummary(name=uploaded_file.name, preview=None, dtypes={}, errors=[str(e)], failed=True)
+        cache.put(digest, summary, _session_id())
+    return summary
+
+
+def release_uploads(uploaded_files):
+    """Tell the cache this session now only uses `uploaded_files`."""
+    hashes = st.session_state.get('_upload_hashes', {})
+    current = {f.file_id for f in uploaded_files}
+    for file_id in list(hashes):
+        if file_id not in current:
+            del hashes[file_id]
+    upload_cache().release(_session_id(), keep=set(hashes.values()))
@@ -0,0 +1,99 @@
+import importlib
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+HEAVY_MODULES = ['numpy', 'pandas', 'altair', 'matplotlib.figure', 'matplotlib.backends.backend_agg', 'PIL.Image',
+                 'graphviz', 'pydeck']
+
+# Set to 0 to skip warming up, e.g. while benchmarking
+ENV_VAR = 'APP_WARM_UP'
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds per warm-up step of this process, filled in by warm_up()
+report = {}
+# Steps that raised; warm-up logs them and carries on
+failures = []
+
+
+def enabled():
+    return os.environ.get(ENV_VAR, '1') != '0'
+
+
+def _step(timings, name, func, *args):
+    start = time.perf_counter()
+    try:
+        func(*args)
+    except Exception:
+        _LOGGER.exception('Warm-up step %r failed; carrying on without it', name)
+        failures.append(name)
+    timings[name] = time.perf_counter() - start
+
+
+def _warm_section(title):
+    import sections
+
+    module = sections.load(title)
+    if hasattr(module, 'warm_up'):
+        module.warm_up()
+
+
+def _static_assets():
+    from utils import assets
+
+    assets.manifest()
+
+
+def _cheat_sheet():
+    from utils import cheatsheet
+
+    cheatsheet.warm_up()
+
+
+def _search_index():
+    from utils import search
+
+    search.index()
+
+
+def warm_up():
+    """Import the heavy libraries, build every section's demo artifacts and the search index.
+
+    Caches are process wide, so whatever is built here is served to the first visitor
+    as if the app had been running for a while. A step that fails is logged and skipped,
+    so a broken demo never keeps the app from serving. Returns the duration of each step.
+    """
+    import sections
+
+    timings = {}
+    start = time.perf_counter()
+    for name in HEAVY_MODULES:
+        _step(timings, f'import {name}', importlib.import_module, name)
+    for title in sections.TITLES:
+        _step(timings, title, _warm_section, title)
+    _step(timings, 'static assets', _static_assets)
+    _step(timings, 'cheat sheet', _cheat_sheet)
+    _step(timings, 'search index', _search_index)
+    timings['total'] = time.perf_counter() - start
+
+    report.update(timings)
+    _LOGGER.info('Warm-up finished in %.2f s, %d steps failed', timings['total'], len(failures))
+    return timings
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_warm():
+    """Warm up in the background if the server was started without `serve.py`.
+
+    Runs once per process, on the first session, so that session is not held up; later
+    visitors find the caches filled.
+    """
+    if report or not enabled():
+        return None
+    thread = threading.Thread(target=warm_up, name='warm-up', daemon=True)
+    thread.start()
+    return thread
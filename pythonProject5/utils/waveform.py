@@ -0,0 +1,161 @@
+"""Waveform overviews of local audio files, decoded once and kept on disk as min/max peaks."""
+import os
+import shutil
+import subprocess
+import wave
+from pathlib import Path
+
+import streamlit as st
+
+from utils import assets
+from utils.lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+alt = lazy_import('altair')
+
+# Rows of (min, max) stored per second of audio; the chart reduces them to BUCKETS columns
+PEAKS_PER_SECOND = 50
+BUCKETS = 600
+# ffmpeg decodes to mono at this rate, plenty for an overview
+SAMPLE_RATE = 8000
+CHUNK_BYTES = 1 << 20
+CACHE_DIR = assets.APP_DIR / '.cache' / 'waveforms'
+
+
+class NoDecoder(RuntimeError):
+    pass
+
+
+class DecodeError(RuntimeError):
+    pass
+
+
+def _ffmpeg_samples(path):
+    process = subprocess.Popen(
+        ['ffmpeg', '-v', 'error', '-nostdin', '-i', str(path), '-ac', '1', '-ar', str(SAMPLE_RATE), '-f', 'f32le', '-'],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        for chunk in iter(lambda: process.stdout.read(CHUNK_BYTES), b''):
+            yield np.frombuffer(chunk[:len(chunk) // 4 * 4], dtype='<f4')
+    finally:
+        process.stdout.close()
+        if process.wait():
+            raise DecodeError(f'ffmpeg could not decode {path.name}')
+
+
+def _pcm(chunk, width):
+    """Integer PCM bytes as float32 in [-1, 1); 24-bit samples are widened to 32 bits first."""
+    if width == 3:
+        wide = np.zeros((len(chunk) // 3, 4), dtype='u1')
+        wide[:, 1:] = np.frombuffer(chunk, dtype='u1').reshape(-1, 3)
+        chunk, width = wide.tobytes(), 4
+    if width == 1:
+        return (np.frombuffer(chunk, dtype='u1').astype('float32') - 128) / 128
+    return np.frombuffer(chunk, dtype=f'<i{width}').astype('float32') / (1 << (8 * width - 1))
+
+
+def _wave_samples(path, width, channels):
+    try:
+        with wave.open(str(path)) as f:
+            frames = CHUNK_BYTES // (width * channels)
+            for chunk in iter(lambda: f.readframes(frames), b''):
+                yield _pcm(chunk, width).reshape(-1, channels).mean(axis=1)
+    except (wave.Error, EOFError) as e:
+        raise DecodeError(f'{path.name} is not a readable WAV file ({e})') from e
+
+
+def decode(path):
+    """Sample rate of `path` and an iterator over its mono float32 samples, one chunk at a time.
+
+    ffmpeg reads any format; without it only 8, 16, 24 and 32-bit PCM WAV files can be
+    decoded. Files that cannot be read raise DecodeError, possibly only once iterated.
+    """
+    path = Path(path)
+    if shutil.which('ffmpeg'):
+        return SAMPLE_RATE, _ffmpeg_samples(path)
+    if path.suffix.lower() == '.wav':
+        try:
+            with wave.open(str(path)) as f:
+                rate, width, channels = f.getframerate(), f.getsampwidth(), f.getnchannels()
+        except (wave.Error, EOFError) as e:
+            raise DecodeError(f'{path.name} is not a readable WAV file ({e})') from e
+        if width not in (1, 2, 3, 4):
+            raise DecodeError(f'{width * 8}-bit WAV files are not supported')
+        return rate, _wave_samples(path, width, channels)
+    raise NoDecoder(f'Decoding {path.suffix} files needs ffmpeg')
+
+
+def compute_peaks(path):
+    """(min, max) of every 1/PEAKS_PER_SECOND s of `path`, as an (n, 2) float32 array.
+
+    Samples are consumed as they are decoded, so memory stays flat however long the file is.
+    """
+    rate, chunks = decode(path)
+    block = max(rate // PEAKS_PER_SECOND, 1)
+    peaks = []
+    carry = np.empty(0, dtype='float32')
+    for samples in chunks:
+        samples = np.concatenate([carry, samples])
+        whole = len(samples) // block * block
+        blocks = samples[:whole].reshape(-1, block)
+        peaks.append(np.stack([blocks.min(axis=1), blocks.max(axis=1)], axis=1))
+        carry = samples[whole:]
+    if len(carry):
+        peaks.append(np.array([[carry.min(), carry.max()]]))
+    return np.concatenate(peaks).astype('float32') if peaks else np.empty((0, 2), dtype='float32')
+
+
+def peaks(path):
+    """Peaks of `path`, decoded on the first call and read from `.cache/waveforms/` afterwards.
+
+    The cache file is named after the content hash, so it outlives restarts and redeploys
+    and is rebuilt only when the audio itself changes.
+    """
+    target = CACHE_DIR / f'{assets.content_hash(path)[:16]}.{PEAKS_PER_SECOND}.npy'
+    if target.exists():
+        return np.load(target)
+    values = compute_peaks(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+    with open(tmp, 'wb') as f:
+        np.save(f, values)
+    os.replace(tmp, target)
+    return values
+
+
+@st.cache_data(show_spinner=False)
+def _overview(path, mtime_ns, buckets):
+    values = peaks(path)
+    if len(values) > buckets:
+        edges = np.linspace(0, len(values), buckets + 1).astype(int)[:-1]
+        time = edges / PEAKS_PER_SECOND
+        low, high = np.minimum.reduceat(values[:, 0], edges), np.maximum.reduceat(values[:, 1], edges)
+    else:
+        time = np.arange(len(values)) / PEAKS_PER_SECOND
+        low, high = values[:, 0], values[:, 1]
+    return pd.DataFrame({'seconds': time, 'low': low, 'high': high})
+
+
+def overview(path, buckets=BUCKETS):
+    """At most `buckets` rows of (seconds, low, high) for `path`, looked up by path and mtime."""
+    path = Path(path)
+    return _overview(str(path), path.stat().st_mtime_ns, buckets)
+
+
+def waveform_chart(path, buckets=BUCKETS, height=80):
+    """Draw the overview of `path` as a band chart, or say why it cannot be drawn."""
+    try:
+        data = overview(path, buckets)
+    except (NoDecoder, DecodeError) as e:
+        st.caption(f'No waveform preview: {e}.')
+        return None
+    chart = alt.Chart(data, height=height).mark_area(interpolate='step-after').encode(
+        x=alt.X('seconds:Q', title='seconds', scale=alt.Scale(nice=False)),
+        y=alt.Y('low:Q', title=None, axis=None, scale=alt.Scale(domain=[-1, 1])),
+        y2='high:Q',
+        tooltip=[alt.Tooltip('seconds:Q', format='.1f'), alt.Tooltip('low:Q', format='.2f'), alt.Tooltip('high:Q', format='.2f')],
+    )
+    st.altair_chart(chart, use_container_width=True)
+    return None
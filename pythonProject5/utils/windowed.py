@@ -0,0 +1,98 @@
+import streamlit as st
+
+from utils import datasets
+from utils.lazy import lazy_import
+
+np = lazy_import('numpy')
+
+PAGE_SIZES = [50, 100, 500, 1000]
+
+
+# The filter range moves in this many steps, which bounds the filtered views worth caching
+RANGE_STEPS = 100
+
+
+# An entry holds a positions array and a sorted copy of one column, about 12 bytes a row
+@st.cache_resource(max_entries=8, show_spinner="Indexing...")
+def sort_index(name, shape, seed, column):
+    """Row positions of a shared dataset ordered by `column`, plus the sorted values.
+
+    Built once per column and shared by every session, like a database index.
+    """
+    values = datasets.load_shared(name, shape, seed)[column].to_numpy()
+    order = np.argsort(values, kind='stable').astype(np.int64 if len(values) >= 2 ** 31 else np.int32)
+    return order, values[order]
+
+
+def range_value(values, step):
+    """Value at `step` of RANGE_STEPS between the first and last of the sorted `values`."""
+    if step >= RANGE_STEPS:
+        return values[-1]
+    return values[0] + (values[-1] - values[0]) * step / RANGE_STEPS
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def filtered_positions(name, shape, seed, sort_by, filter_by, low_step, high_step):
+    """Row positions in ascending `sort_by` order whose `filter_by` lies between two range steps.
+
+    The range is found by binary search on the filter column's index; the matches are
+    put in sort order with one boolean mask pass over the sort column's index.
+    """
+    order, _ = sort_index(name, shape, seed, sort_by)
+    filter_order, filter_values = sort_index(name, shape, seed, filter_by)
+    start = np.searchsorted(filter_values, range_value(filter_values, low_step), side='left')
+    stop = np.searchsorted(filter_values, range_value(filter_values, high_step), side='right')
+    keep = np.zeros(len(order), dtype=bool)
+    keep[filter_order[start:stop]] = True
+    return order[keep[order]]
+
+
+def view_positions(name, shape, seed, sort_by, descending, filter_by=None, low_step=0, high_step=RANGE_STEPS):
+    """Row positions in display order; descending and unfiltered views are views of a cached array."""
+    if filter_by is None or (low_step, high_step) == (0, RANGE_STEPS):
+        order, _ = sort_index(name, shape, seed, sort_by)
+    else:
+        order = filtered_positions(name, shape, seed, sort_by, filter_by, low_step, high_step)
+    return order[::-1] if descending else order
+
+
+def prebuild(name, shape, seed=0):
+    """Build the shared frame and the index behind the viewer's default view."""
+    frame = datasets.load_shared(name, shape, seed)
+    sort_by = frame.select_dtypes('number').columns[0]
+    view_positions(name, shape, seed, sort_by, False)
+
+
+def windowed_dataframe(name, shape, seed=0, key='windowed'):
+    """Page through a shared dataset of any size, serializing only the visible window.
+
+    Sorting and filtering run on the server against cached indexes, so memory per session
+    and the payload per rerun are bounded by the page size, not the number of rows.
+    """
+    frame = datasets.load_shared(name, shape, seed)
+    numeric = list(frame.select_dtypes('number').columns)
+
+    col1, col2, col3 = st.columns(3)
+    sort_by = col1.selectbox('Sort by', numeric, key=f'{key}_sort')
+    descending = col1.toggle('Descending', key=f'{key}_descending')
+    filter_by = col2.selectbox('Filter', [None] + numeric, format_func=lambda c: c or 'No filter',
+                               key=f'{key}_filter')
+    low, high = 0, RANGE_STEPS
+    if filter_by is not None:
+        _, values = sort_index(name, shape, seed, filter_by)
+        low, high = col2.select_slider('Range', range(RANGE_STEPS + 1), (0, RANGE_STEPS),
+                                       format_func=lambda step: f'{range_value(values, step):.4g}',
+                                       key=f'{key}_range')
+    page_size = col3.selectbox('Rows per page', PAGE_SIZES, key=f'{key}_page_size')
+
+    positions = view_positions(name, shape, seed, sort_by, descending, filter_by, low, high)
+    pages = max(1, -(-len(positions) // page_size))
+    if st.session_state.get(f'{key}_page', 1) > pages:
+        st.session_state[f'{key}_page'] = pages
+    page = col3.number_input(f'Page (of {pages:,})', 1, pages, key=f'{key}_page')
+
+    start = (page - 1) * page_size
+    window = positions[start:start + page_size]
+    st.dataframe(frame.iloc[window], hide_index=True)
+    st.caption(f'Rows {start + 1:,}–{start + len(window):,} of {len(positions):,} matching, '
+               f'{len(frame):,} in total')